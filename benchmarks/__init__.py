@@ -0,0 +1,6 @@
+"""
+Benchmark suite of SQLLineage, measuring LineageRunner on synthetic SQL of different shapes.
+
+Run it from the repository root with `python -m benchmarks`, see `python -m benchmarks --help` for options. Results
+are written as JSON, and can be compared with those of a previous run with --baseline.
+"""
@@ -0,0 +1,137 @@
+import argparse
+import json
+import platform
+import sys
+from typing import Any, Dict, List
+
+from benchmarks.generators import SCENARIOS
+from benchmarks.harness import Measurement, measure
+from sqllineage import SQLPARSE_DIALECT, VERSION
+from sqllineage.utils.constant import LineageLevel
+
+DEFAULT_DIALECTS = [SQLPARSE_DIALECT, "ansi"]
+
+
+def compare(results: List[Measurement], baseline: Dict[str, Any]) -> List[str]:
+    """
+    :param results: measurements of this run
+    :param baseline: results previously written by this suite
+    :return: one line per measurement found in baseline at the same size, with the ratio of p50 latency, p50 time
+    spent extracting lineage when baseline has it, and peak memory
+    """
+    previous = {
+        f"{r['scenario']}/{r['dialect']}/{r['level']}": r for r in baseline["results"]
+    }
+    lines = []
+    for result in results:
+        before = previous.get(result.key)
+        if before is None or before["size"] != result.size:
+            continue
+        line = f"{result.key:<40} p50 {result.p50_ms / before['p50_ms']:.2f}x "
+        if before.get("extract_p50_ms"):
+            line += f"extract {result.extract_p50_ms / before['extract_p50_ms']:.2f}x "
+        lines.append(
+            line + f"memory {result.peak_memory_kb / before['peak_memory_kb']:.2f}x"
+        )
+    return lines
+
+
+def main(args=None) -> None:
+    """
+    The command line interface entry point of the benchmark suite.
+
+    :param args: the command line arguments
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark SQLLineage on synthetic SQL.",
+    )
+    parser.add_argument(
+        "-s",
+        "--scenarios",
+        help="scenarios to run, default to all of them",
+        nargs="+",
+        choices=list(SCENARIOS),
+        default=list(SCENARIOS),
+        metavar="<scenario>",
+    )
+    parser.add_argument(
+        "-d",
+        "--dialects",
+        help=f"dialects to analyze with, default to {' '.join(DEFAULT_DIALECTS)}",
+        nargs="+",
+        default=DEFAULT_DIALECTS,
+        metavar="<dialect>",
+    )
+    parser.add_argument(
+        "-l",
+        "--levels",
+        help="lineage levels to measure, default to both",
+        nargs="+",
+        choices=[LineageLevel.TABLE, LineageLevel.COLUMN],
+        default=[LineageLevel.TABLE, LineageLevel.COLUMN],
+    )
+    parser.add_argument(
+        "--scale",
+        help="multiply the default size of each scenario",
+        type=float,
+        default=1.0,
+        metavar="<factor>",
+    )
+    parser.add_argument(
+        "-n",
+        "--repeat",
+        help="number of timed runs for each measurement",
+        type=int,
+        default=5,
+        metavar="<count>",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="write results as JSON to this file instead of stdout",
+        metavar="<filename>",
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        help="JSON results of a previous run to compare with",
+        metavar="<filename>",
+    )
+    args = parser.parse_args(args)
+
+    results = []
+    for name in args.scenarios:
+        scenario = SCENARIOS[name]
+        size = max(int(scenario.size * args.scale), 1)
+        sql = scenario.generator(size)
+        for dialect in args.dialects:
+            for level in args.levels:
+                result = measure(name, sql, size, dialect, level, args.repeat)
+                print(
+                    f"{result.key:<40} p50 {result.p50_ms:>10.2f}ms "
+                    f"p99 {result.p99_ms:>10.2f}ms extract {result.extract_p50_ms:>10.2f}ms "
+                    f"{result.throughput:>10.2f} stmt/s "
+                    f"{result.peak_memory_kb:>10.1f}KB",
+                    file=sys.stderr,
+                )
+                results.append(result)
+
+    report = {
+        "sqllineage": VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": args.scale,
+        "repeat": args.repeat,
+        "results": [result.to_dict() for result in results],
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    if args.baseline:
+        with open(args.baseline) as f:
+            for line in compare(results, json.load(f)):
+                print(line, file=sys.stderr)
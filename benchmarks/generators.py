@@ -0,0 +1,115 @@
+"""
+Synthetic SQL generators, one per statement shape worth tracking.
+
+Each generator takes a size and returns a script. The size is the dimension that grows with the shape: number of
+columns for a wide select, number of chained CTEs, number of union branches, number of statements in a script or
+number of renames in a migration.
+"""
+
+from typing import Callable, Dict, NamedTuple
+
+
+def wide_select(size: int) -> str:
+    """
+    INSERT ... SELECT with size columns, mixing plain columns, expressions and CASE over a join
+    """
+    columns = []
+    for i in range(size):
+        if i % 3 == 0:
+            columns.append(f"a.col{i}")
+        elif i % 3 == 1:
+            columns.append(f"a.col{i} + b.col{i} AS expr{i}")
+        else:
+            columns.append(
+                f"CASE WHEN a.col{i} > 0 THEN b.col{i} ELSE 0 END AS case{i}"
+            )
+    return (
+        "INSERT INTO tgt\nSELECT "
+        + ",\n       ".join(columns)
+        + "\nFROM src1 a\nJOIN src2 b ON a.id = b.id"
+    )
+
+
+def deep_cte(size: int) -> str:
+    """
+    INSERT ... SELECT at the end of a chain of size CTEs, each one reading from the previous
+    """
+    ctes = ["cte0 AS (SELECT id, val FROM src)"]
+    for i in range(1, size):
+        ctes.append(f"cte{i} AS (SELECT id, val + {i} AS val FROM cte{i - 1})")
+    return (
+        "INSERT INTO tgt\nWITH "
+        + ",\n".join(ctes)
+        + f"\nSELECT id, val FROM cte{size - 1}"
+    )
+
+
+def long_union(size: int) -> str:
+    """
+    INSERT ... SELECT of size branches chained with UNION ALL
+    """
+    return "INSERT INTO tgt\n" + "\nUNION ALL\n".join(
+        f"SELECT id, val{i % 7} AS val FROM src{i}" for i in range(size)
+    )
+
+
+def many_statements(size: int) -> str:
+    """
+    A script of size short statements, cycling through the common DML and DDL shapes
+    """
+    templates = [
+        "INSERT INTO tab{i} SELECT id, val FROM src{i}",
+        "CREATE TABLE tab{i}_copy AS SELECT * FROM tab{i}",
+        "CREATE VIEW view{i} AS SELECT a.id, b.val FROM src{i} a JOIN dim b ON a.id = b.id",
+        "DROP TABLE IF EXISTS tmp{i}",
+        "INSERT INTO agg{i} SELECT id, count(*) AS cnt FROM tab{i} GROUP BY id",
+    ]
+    return (
+        ";\n".join(templates[i % len(templates)].format(i=i) for i in range(size)) + ";"
+    )
+
+
+def rename_migration(size: int) -> str:
+    """
+    A migration script renaming size tables through a staging name, with a backfill for each one
+    """
+    statements = []
+    for i in range(size):
+        statements.append(f"CREATE TABLE tab{i}_new AS SELECT * FROM tab{i}")
+        statements.append(f"ALTER TABLE tab{i} RENAME TO tab{i}_old")
+        statements.append(f"ALTER TABLE tab{i}_new RENAME TO tab{i}")
+        statements.append(f"DROP TABLE tab{i}_old")
+    return ";\n".join(statements) + ";"
+
+
+def nested_subqueries(size: int) -> str:
+    """
+    A script of size INSERT ... SELECT over joined subqueries, some nested and some filtered by another subquery, with
+    CASE and CAST in the select list. Extracting its lineage mostly walks FROM clauses and subqueries of the parse tree.
+    """
+    template = (
+        "INSERT INTO tgt{i}\n"
+        "SELECT a.id,\n"
+        "       CAST(a.val AS INT) AS val,\n"
+        "       CASE WHEN b.flag = 1 THEN b.val ELSE 0 END AS flagged\n"
+        "FROM (SELECT id, val FROM src{i} WHERE id IN (SELECT id FROM filter{i})) a\n"
+        "JOIN (SELECT id, flag, val FROM (SELECT id, flag, val FROM dim{i}) d) b ON a.id = b.id\n"
+        "LEFT JOIN (SELECT id FROM ref{i}) c ON a.id = c.id"
+    )
+    return ";\n".join(template.format(i=i) for i in range(size)) + ";"
+
+
+class Scenario(NamedTuple):
+    generator: Callable[[int], str]
+    size: int
+
+
+# default sizes keep a full run within a few minutes, use --scale to grow them
+SCENARIOS: Dict[str, Scenario] = {
+    "wide_select": Scenario(wide_select, 100),
+    "deep_cte": Scenario(deep_cte, 20),
+    "long_union": Scenario(long_union, 50),
+    "many_statements": Scenario(many_statements, 100),
+    "rename_migration": Scenario(rename_migration, 25),
+    "nested_subqueries": Scenario(nested_subqueries, 10),
+}
@@ -0,0 +1,100 @@
+"""
+Measure LineageRunner on a SQL script: latency percentiles, throughput, time spent extracting lineage and peak memory.
+
+The lineage cache is cleared before every run, so that each sample pays for parsing and analyzing all over again
+instead of measuring cache lookups. Runs are profiled, so that the time spent extracting lineage from parsed statements
+is reported apart from parsing, which takes most of the latency with sqlfluff.
+"""
+
+import math
+import time
+import tracemalloc
+from typing import Any, Dict, List, NamedTuple
+
+from sqllineage import SQLPARSE_DIALECT
+from sqllineage.core.cache import lineage_cache
+from sqllineage.runner import LineageRunner
+from sqllineage.utils.constant import LineageLevel
+
+
+class Measurement(NamedTuple):
+    scenario: str
+    parser: str
+    dialect: str
+    level: str
+    size: int
+    statements: int
+    repeat: int
+    throughput: float
+    p50_ms: float
+    p99_ms: float
+    extract_p50_ms: float
+    peak_memory_kb: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.scenario}/{self.dialect}/{self.level}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    :param samples: measured values, not necessarily sorted
+    :param pct: percentile between 0 and 100
+    :return: the nearest-rank percentile of samples
+    """
+    ordered = sorted(samples)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(rank - 1, 0)]
+
+
+def run_once(sql: str, dialect: str, level: str) -> LineageRunner:
+    """
+    Analyze sql from scratch at the given lineage level.
+    """
+    lineage_cache.clear()
+    runner = LineageRunner(sql, dialect=dialect, profile=True)
+    if level == LineageLevel.COLUMN:
+        runner.get_column_lineage()
+    else:
+        runner.source_tables
+    return runner
+
+
+def measure(
+    scenario: str, sql: str, size: int, dialect: str, level: str, repeat: int
+) -> Measurement:
+    """
+    Run the analysis repeat times after one warm-up run, then once more under tracemalloc for peak memory.
+    """
+    statements = len(run_once(sql, dialect, level).statements())
+    samples, extract_samples = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        runner = run_once(sql, dialect, level)
+        samples.append(time.perf_counter() - start)
+        extract_samples.append(runner.profile.stages["extract"])  # type: ignore
+    # tracing allocations slows everything down, so memory gets its own run
+    tracemalloc.start()
+    try:
+        run_once(sql, dialect, level)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    p50 = percentile(samples, 50)
+    return Measurement(
+        scenario=scenario,
+        parser="sqlparse" if dialect == SQLPARSE_DIALECT else "sqlfluff",
+        dialect=dialect,
+        level=level,
+        size=size,
+        statements=statements,
+        repeat=repeat,
+        throughput=round(statements / p50, 2),
+        p50_ms=round(p50 * 1000, 3),
+        p99_ms=round(percentile(samples, 99) * 1000, 3),
+        extract_p50_ms=round(percentile(extract_samples, 50) * 1000, 3),
+        peak_memory_kb=round(peak / 1024, 1),
+    )
@@ -48,7 +48,7 @@ setup(
     description="OpenMetadata SQL Lineage for Analysis Tool powered by Python and sqlfluff based on sqllineage.",
     long_description=long_description,
     long_description_content_type="text/markdown",
-    packages=find_packages(exclude=("tests",)),
+    packages=find_packages(exclude=("tests", "benchmarks")),
     package_data={"": [f"{STATIC_FOLDER}/*", f"{STATIC_FOLDER}/**/**/*", "data/**/*"]},
     include_package_data=True,
     classifiers=[
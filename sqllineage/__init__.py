@@ -38,3 +38,13 @@ DEFAULT_HOST = "localhost"
 DEFAULT_PORT = 5000
 SQLPARSE_DIALECT = "non-validating"
 DEFAULT_DIALECT = SQLPARSE_DIALECT
+# maximum number of statement lineage results kept in memory, 0 to disable the cache
+LINEAGE_CACHE_SIZE = int(os.environ.get("SQLLINEAGE_CACHE_SIZE", 1024))
+# directory to persist statement lineage results across processes, persistent cache is off when not set
+LINEAGE_CACHE_DIRECTORY = os.environ.get("SQLLINEAGE_CACHE_DIRECTORY")
+# maximum size in bytes for the persistent cache directory, enforced when pruning
+LINEAGE_CACHE_DIRECTORY_MAX_BYTES = int(
+    os.environ.get("SQLLINEAGE_CACHE_DIRECTORY_MAX_BYTES", 256 * 1024 * 1024)
+)
+# graph backend of lineage holders, "networkx" or "compact", see sqllineage.core.graph
+GRAPH_BACKEND = os.environ.get("SQLLINEAGE_GRAPH_BACKEND", "networkx")
@@ -1,13 +1,22 @@
 import argparse
 import logging
 import logging.config
+import sys
 
 
-from sqllineage import DEFAULT_DIALECT, DEFAULT_HOST, DEFAULT_LOGGING, DEFAULT_PORT
+from sqllineage import (
+    DEFAULT_DIALECT,
+    DEFAULT_HOST,
+    DEFAULT_LOGGING,
+    DEFAULT_PORT,
+    LINEAGE_CACHE_DIRECTORY,
+    LINEAGE_CACHE_DIRECTORY_MAX_BYTES,
+)
+from sqllineage.core.cache import DiskLineageCache, lineage_cache
 from sqllineage.drawing import draw_lineage_graph
 from sqllineage.runner import LineageRunner
 from sqllineage.utils.constant import LineageLevel
-from sqllineage.utils.helpers import extract_sql_from_args
+from sqllineage.utils.helpers import check_sql_file, extract_sql_from_args
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +49,16 @@ def main(args=None) -> None:
         choices=[LineageLevel.TABLE, LineageLevel.COLUMN],
         default=LineageLevel.TABLE,
     )
+    parser.add_argument(
+        "--endpoints-only",
+        help="for column level lineage, only show source and target column without intermediate ones",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--profile",
+        help="print time spent per stage and the slowest statements to stderr after the lineage result",
+        action="store_true",
+    )
     parser.add_argument(
         "-g",
         "--graph-visualization",
@@ -76,29 +95,75 @@ def main(args=None) -> None:
         help="list all the available dialects",
         action="store_true",
     )
+    parser.add_argument(
+        "--cache-dir",
+        help="directory to persist statement lineage results across invocations, "
+        "default to env SQLLINEAGE_CACHE_DIRECTORY",
+        type=str,
+        default=LINEAGE_CACHE_DIRECTORY,
+        metavar="<directory>",
+    )
+    parser.add_argument(
+        "--cache-max-bytes",
+        help="size cap of the cache directory, least recently used entries are pruned beyond it",
+        type=int,
+        default=LINEAGE_CACHE_DIRECTORY_MAX_BYTES,
+        metavar="<bytes>",
+    )
+    parser.add_argument(
+        "--prune-cache",
+        help="prune the cache directory down to its size cap and exit",
+        action="store_true",
+    )
     args = parser.parse_args(args)
+    disk_cache = (
+        DiskLineageCache(args.cache_dir, args.cache_max_bytes)
+        if args.cache_dir
+        else None
+    )
+    if args.prune_cache:
+        if disk_cache is None:
+            parser.error("--prune-cache requires --cache-dir")
+        removed = disk_cache.prune()
+        print(f"Pruned {removed} entries from {args.cache_dir}")
+        return
     if args.e and args.f:
         logging.warning(
             "Both -e and -f options are specified. -e option will be ignored"
         )
     if args.f or args.e:
-        sql = extract_sql_from_args(args)
-        runner = LineageRunner(
-            sql,
-            dialect=args.dialect,
-            verbose=args.verbose,
-            draw_options={
+        runner_options = {
+            "dialect": args.dialect,
+            "verbose": args.verbose,
+            "profile": args.profile,
+            "draw_options": {
                 "host": args.host,
                 "port": args.port,
                 "f": args.f if args.f else None,
             },
-        )
-        if args.graph_visualization:
-            runner.draw(args.dialect)
-        elif args.level == LineageLevel.COLUMN:
-            runner.print_column_lineage()
-        else:
-            runner.print_table_lineage()
+        }
+        # the disk cache only applies to this invocation, restore the process-wide one afterwards
+        previous_disk_cache = lineage_cache.persistent
+        lineage_cache.persistent = disk_cache
+        try:
+            if args.f:
+                # statements are streamed from file, so that a huge script doesn't need to fit in memory
+                check_sql_file(args.f)
+                runner = LineageRunner.from_file(args.f, **runner_options)
+            else:
+                runner = LineageRunner(extract_sql_from_args(args), **runner_options)
+            if args.graph_visualization:
+                runner.draw(args.dialect)
+            elif args.level == LineageLevel.COLUMN:
+                runner.print_column_lineage(endpoints_only=args.endpoints_only)
+            else:
+                runner.print_table_lineage()
+        finally:
+            lineage_cache.persistent = previous_disk_cache
+        if runner.profile is not None:
+            print(runner.profile.report(), file=sys.stderr)
+        if disk_cache is not None:
+            disk_cache.prune()
     elif args.graph_visualization:
         return draw_lineage_graph(**{"host": args.host, "port": args.port})
     elif args.dialects:
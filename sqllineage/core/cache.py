@@ -0,0 +1,247 @@
+"""
+Cache of statement level lineage result, in memory and optionally persisted on disk.
+
+The same statement analyzed with the same dialect always gives the same lineage, so the result can be looked up
+by a content hash of the statement instead of parsing it again. sqllineage version is also part of the key so that
+cached result never outlives the analyzing logic that produced it.
+
+Cached results are copied in and out, including the tables and columns they hold, so modifying a result never
+changes what is cached. Warnings raised while analyzing a statement are not raised again when its result is served
+from cache.
+"""
+
+import hashlib
+import logging
+import os
+import pickle  # nosec
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple, Optional, Tuple
+
+from sqllineage import (
+    LINEAGE_CACHE_DIRECTORY,
+    LINEAGE_CACHE_DIRECTORY_MAX_BYTES,
+    LINEAGE_CACHE_SIZE,
+    VERSION,
+)
+from sqllineage.core.holders import StatementLineageHolder
+
+logger = logging.getLogger(__name__)
+
+
+def _copy(holder: StatementLineageHolder) -> StatementLineageHolder:
+    # nodes are mutable, e.g. a column gets parent assigned, so copying the graph structure alone would still share
+    # them between cache and caller. A pickle round trip copies the nodes too, the same way as disk cache does.
+    copied = pickle.loads(pickle.dumps(holder, pickle.HIGHEST_PROTOCOL))  # nosec
+    return copied  # type: ignore
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+class DiskLineageCache:
+    """
+    Persistent cache of :class:`sqllineage.core.holders.StatementLineageHolder`, one pickle file per statement.
+
+    Files are laid out as <directory>/<version>/<dialect>/<hash[:2]>/<hash>.pickle. Each file is written to a temporary
+    file first and then atomically moved in place, so concurrent writers never leave a partially written entry.
+    Only point it to a directory you trust, entries are unpickled when read.
+    """
+
+    SUFFIX = ".pickle"
+
+    def __init__(
+        self, directory: str, max_bytes: int = LINEAGE_CACHE_DIRECTORY_MAX_BYTES
+    ):
+        """
+        :param directory: the cache directory, created when first written
+        :param max_bytes: maximum size of the cache directory, enforced by prune
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = self.misses = 0
+
+    def _path(self, key: Tuple[str, str, str]) -> Path:
+        digest, dialect, version = key
+        return self.directory.joinpath(
+            version, dialect, digest[:2], digest + self.SUFFIX
+        )
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[StatementLineageHolder]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                holder = pickle.load(f)  # nosec
+            # refresh modification time so that prune evicts least recently used entries first
+            os.utime(path)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return holder  # type: ignore
+
+    def put(self, key: Tuple[str, str, str], holder: StatementLineageHolder) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(holder, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, path)
+            finally:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+        except OSError:
+            # cache is best effort, failing to write it shouldn't fail the lineage analysis
+            logger.warning("failed to write lineage cache file %s", path)
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Remove entries written by other sqllineage versions, then remove least recently used entries until the
+        directory fits in max_bytes.
+
+        :param max_bytes: size cap to enforce, default to the one given at construction
+        :return: number of entries removed
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        removed = 0
+        if not self.directory.is_dir():
+            return removed
+        for version_dir in self.directory.iterdir():
+            if version_dir.is_dir() and version_dir.name != VERSION:
+                removed += sum(1 for _ in version_dir.rglob("*" + self.SUFFIX))
+                shutil.rmtree(version_dir, ignore_errors=True)
+        entries = []
+        for path in self.directory.rglob("*" + self.SUFFIX):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda x: x[0]):
+            if total <= max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+
+class LineageCache:
+    """
+    Thread-safe LRU cache of :class:`sqllineage.core.holders.StatementLineageHolder`, backed by an optional
+    :class:`DiskLineageCache` which is looked up on memory miss
+    """
+
+    def __init__(
+        self,
+        max_size: int = LINEAGE_CACHE_SIZE,
+        persistent: Optional[DiskLineageCache] = None,
+    ):
+        """
+        :param max_size: maximum number of statements to keep in memory, 0 to disable the in-memory cache
+        :param persistent: persistent cache shared across processes
+        """
+        self.max_size = max_size
+        self.persistent = persistent
+        self.enabled = max_size > 0
+        self._entries: "OrderedDict[Tuple[str, str, str], StatementLineageHolder]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    @staticmethod
+    def key(sql: str, dialect: str) -> Tuple[str, str, str]:
+        """
+        :return: the cache key of a statement: (content hash, dialect, sqllineage version)
+        """
+        normalized = sql.strip().replace("\r\n", "\n")
+        return (
+            hashlib.sha256(normalized.encode("utf-8")).hexdigest(),
+            dialect,
+            VERSION,
+        )
+
+    def get(self, sql: str, dialect: str) -> Optional[StatementLineageHolder]:
+        """
+        :return: a copy of the cached lineage result, or None if the statement is not cached
+        """
+        key = self.key(sql, dialect)
+        if self.enabled:
+            with self._lock:
+                holder = self._entries.get(key)
+                if holder is None:
+                    self.misses += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+            if holder is not None:
+                # hand out a copy so that the cached graph is never modified by caller
+                return _copy(holder)
+        if self.persistent is not None:
+            holder = self.persistent.get(key)
+            if holder is not None:
+                self._put_in_memory(key, holder)
+                return holder
+        return None
+
+    def put(self, sql: str, dialect: str, holder: StatementLineageHolder) -> None:
+        """
+        Cache the lineage result of a statement, evicting the least recently used ones when cache is full.
+        """
+        key = self.key(sql, dialect)
+        if self.persistent is not None:
+            self.persistent.put(key, holder)
+        self._put_in_memory(key, holder)
+
+    def _put_in_memory(
+        self, key: Tuple[str, str, str], holder: StatementLineageHolder
+    ) -> None:
+        if not self.enabled:
+            return
+        cached = _copy(holder)
+        with self._lock:
+            self._entries[key] = cached
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Drop all the cached results and reset the counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                self.hits,
+                self.misses,
+                self.evictions,
+                len(self._entries),
+                self.max_size,
+            )
+
+
+lineage_cache = LineageCache(
+    persistent=(
+        DiskLineageCache(LINEAGE_CACHE_DIRECTORY) if LINEAGE_CACHE_DIRECTORY else None
+    )
+)
@@ -0,0 +1,399 @@
+"""
+Graph backends for lineage holders.
+
+By default lineage is held in a networkx DiGraph. Each node there costs a dict of attributes plus a dict of successors
+and a dict of predecessors, and each edge another attribute dict, which adds up when combining lineage for tens of
+thousands of statements. CompactDiGraph holds the same lineage with nodes numbered in an interned table, node tags as
+bit flags, and edges as arrays of integers with one byte for the edge type.
+
+CompactDiGraph only implements the part of DiGraph API that lineage holders and :func:`sqllineage.io.to_cytoscape`
+use. Call :func:`to_networkx` whenever a full networkx DiGraph is needed.
+
+Set environment variable SQLLINEAGE_GRAPH_BACKEND to "compact" to switch backend.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import networkx as nx
+from networkx import DiGraph
+
+from sqllineage import GRAPH_BACKEND
+from sqllineage.utils.constant import EdgeType, NodeTag
+
+COMPACT_BACKEND = "compact"
+NETWORKX_BACKEND = "networkx"
+
+# bit flag for each node tag, other node attributes are kept in a dict aside
+_TAG_BITS = {
+    tag: 1 << i
+    for i, tag in enumerate(
+        [
+            NodeTag.READ,
+            NodeTag.WRITE,
+            NodeTag.CTE,
+            NodeTag.DROP,
+            NodeTag.SOURCE_ONLY,
+            NodeTag.TARGET_ONLY,
+            NodeTag.SELFLOOP,
+        ]
+    )
+}
+_NO_TYPE = 0
+_REMOVED_EDGE = -1
+
+
+class _RemovedNode:
+    def __repr__(self):
+        return "<removed>"
+
+
+_REMOVED_NODE = _RemovedNode()
+
+
+class _NodeView:
+    def __init__(self, graph: "CompactDiGraph"):
+        self._graph = graph
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._graph._iter_nodes()
+
+    def __len__(self) -> int:
+        return len(self._graph._index)
+
+    def __contains__(self, node) -> bool:
+        return node in self._graph._index
+
+    def __getitem__(self, node) -> Dict[str, Any]:
+        # a copy of the attributes, updating it doesn't change the graph
+        return self._graph._node_attr(self._graph._index[node])
+
+    def __call__(self, data: bool = False) -> Iterable[Any]:
+        if not data:
+            return self
+        g = self._graph
+        return [(g._nodes[i], g._node_attr(i)) for i in g._iter_node_ids()]
+
+
+class _EdgeView:
+    def __init__(self, graph: "CompactDiGraph"):
+        self._graph = graph
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        g = self._graph
+        for i in g._iter_node_ids():
+            for e in g._succ[i]:
+                yield g._nodes[i], g._nodes[g._dst[e]]
+
+    def __len__(self) -> int:
+        return len(self._graph._edge_ids)
+
+    def __call__(self, data: bool = False) -> Iterable[Tuple[Any, ...]]:
+        if not data:
+            return list(self)
+        g = self._graph
+        return [
+            (g._nodes[i], g._nodes[g._dst[e]], g._edge_attr(e))
+            for i in g._iter_node_ids()
+            for e in g._succ[i]
+        ]
+
+
+class _DegreeView:
+    def __init__(self, graph: "CompactDiGraph", succ: bool, pred: bool):
+        self._graph = graph
+        self._succ = succ
+        self._pred = pred
+
+    def _degree(self, i: int) -> int:
+        g = self._graph
+        return (len(g._succ[i]) if self._succ else 0) + (
+            len(g._pred[i]) if self._pred else 0
+        )
+
+    def __getitem__(self, node) -> int:
+        return self._degree(self._graph._index[node])
+
+    def __iter__(self) -> Iterator[Tuple[Any, int]]:
+        g = self._graph
+        for i in g._iter_node_ids():
+            yield g._nodes[i], self._degree(i)
+
+
+class CompactDiGraph:
+    """
+    A directed graph storing nodes by integer id and edges in integer arrays
+    """
+
+    def __init__(self) -> None:
+        self.graph: Dict[str, Any] = {}
+        # node id is the position in _nodes, a removed node leaves a hole
+        self._nodes: List[Any] = []
+        self._index: Dict[Any, int] = {}
+        self._tags = array("B")
+        self._node_extra: Dict[int, Dict[str, Any]] = {}
+        # edge id is the position in _src/_dst/_type, a removed edge has its type set to _REMOVED_EDGE
+        self._src = array("i")
+        self._dst = array("i")
+        self._type = array("b")
+        self._edge_extra: Dict[int, Dict[str, Any]] = {}
+        self._edge_ids: Dict[int, int] = {}
+        # out and in edge ids of each node, in insertion order
+        self._succ: List["array[int]"] = []
+        self._pred: List["array[int]"] = []
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._iter_nodes()
+
+    def __contains__(self, node) -> bool:
+        return node in self._index
+
+    def __getstate__(self):
+        # holes left by removed nodes and edges are not worth pickling
+        compacted = self.copy()
+        return compacted.__dict__
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def _iter_node_ids(self) -> Iterator[int]:
+        return (i for i, n in enumerate(self._nodes) if n is not _REMOVED_NODE)
+
+    def _iter_nodes(self) -> Iterator[Any]:
+        return (n for n in self._nodes if n is not _REMOVED_NODE)
+
+    def _node_attr(self, i: int) -> Dict[str, Any]:
+        bits = self._tags[i]
+        attr = {tag: True for tag, bit in _TAG_BITS.items() if bits & bit}
+        extra = self._node_extra.get(i)
+        if extra:
+            attr.update(extra)
+        return attr
+
+    def _edge_attr(self, e: int) -> Dict[str, Any]:
+        code = self._type[e]
+        attr: Dict[str, Any] = {} if code == _NO_TYPE else {"type": EdgeType(code)}
+        extra = self._edge_extra.get(e)
+        if extra:
+            attr.update(extra)
+        return attr
+
+    def _node_id(self, node) -> int:
+        i = self._index.get(node)
+        if i is None:
+            if node is None:
+                raise ValueError("None cannot be a node")
+            i = self._index[node] = len(self._nodes)
+            self._nodes.append(node)
+            self._tags.append(0)
+            self._succ.append(array("i"))
+            self._pred.append(array("i"))
+        return i
+
+    def _edge_key(self, u: int, v: int) -> int:
+        return (u << 32) | v
+
+    @property
+    def nodes(self) -> _NodeView:
+        return _NodeView(self)
+
+    @property
+    def edges(self) -> _EdgeView:
+        return _EdgeView(self)
+
+    @property
+    def degree(self) -> _DegreeView:
+        return _DegreeView(self, succ=True, pred=True)
+
+    @property
+    def in_degree(self) -> _DegreeView:
+        return _DegreeView(self, succ=False, pred=True)
+
+    @property
+    def out_degree(self) -> _DegreeView:
+        return _DegreeView(self, succ=True, pred=False)
+
+    def is_directed(self) -> bool:
+        return True
+
+    def number_of_nodes(self) -> int:
+        return len(self._index)
+
+    def number_of_edges(self) -> int:
+        return len(self._edge_ids)
+
+    def has_node(self, node) -> bool:
+        return node in self._index
+
+    def has_edge(self, u, v) -> bool:
+        i, j = self._index.get(u), self._index.get(v)
+        return (
+            i is not None and j is not None and self._edge_key(i, j) in self._edge_ids
+        )
+
+    def add_node(self, node, **attr) -> None:
+        i = self._node_id(node)
+        for key, value in attr.items():
+            bit = _TAG_BITS.get(key)
+            if bit is not None and value is True:
+                self._tags[i] |= bit
+                extra = self._node_extra.get(i)
+                if extra:
+                    extra.pop(key, None)
+            else:
+                if bit is not None:
+                    self._tags[i] &= ~bit
+                self._node_extra.setdefault(i, {})[key] = value
+
+    def add_nodes_from(self, nodes: Iterable[Any]) -> None:
+        for node in nodes:
+            if isinstance(node, tuple) and len(node) == 2 and isinstance(node[1], dict):
+                self.add_node(node[0], **node[1])
+            else:
+                self.add_node(node)
+
+    def add_edge(self, u, v, **attr) -> None:
+        i, j = self._node_id(u), self._node_id(v)
+        key = self._edge_key(i, j)
+        e = self._edge_ids.get(key)
+        if e is None:
+            e = self._edge_ids[key] = len(self._src)
+            self._src.append(i)
+            self._dst.append(j)
+            self._type.append(_NO_TYPE)
+            self._succ[i].append(e)
+            self._pred[j].append(e)
+        for name, value in attr.items():
+            if name == "type" and isinstance(value, EdgeType):
+                self._type[e] = value.value
+            elif name == "type":
+                self._type[e] = _NO_TYPE
+                self._edge_extra.setdefault(e, {})[name] = value
+            else:
+                self._edge_extra.setdefault(e, {})[name] = value
+
+    def add_edges_from(self, edges: Iterable[Tuple[Any, ...]]) -> None:
+        for edge in edges:
+            if len(edge) == 3:
+                self.add_edge(edge[0], edge[1], **edge[2])
+            else:
+                self.add_edge(edge[0], edge[1])
+
+    def _remove_edge_id(self, e: int) -> None:
+        i, j = self._src[e], self._dst[e]
+        del self._edge_ids[self._edge_key(i, j)]
+        self._succ[i].remove(e)
+        self._pred[j].remove(e)
+        self._type[e] = _REMOVED_EDGE
+        self._edge_extra.pop(e, None)
+
+    def remove_edge(self, u, v) -> None:
+        i, j = self._index.get(u), self._index.get(v)
+        e = (
+            self._edge_ids.get(self._edge_key(i, j))
+            if i is not None and j is not None
+            else None
+        )
+        if e is None:
+            raise nx.NetworkXError(f"The edge {u}-{v} is not in the graph")
+        self._remove_edge_id(e)
+
+    def remove_node(self, node) -> None:
+        i = self._index.get(node)
+        if i is None:
+            raise nx.NetworkXError(f"The node {node} is not in the graph.")
+        for e in set(self._succ[i]) | set(self._pred[i]):
+            self._remove_edge_id(e)
+        del self._index[node]
+        self._nodes[i] = _REMOVED_NODE
+        self._tags[i] = 0
+        self._node_extra.pop(i, None)
+
+    def successors(self, node) -> Iterator[Any]:
+        return (self._nodes[self._dst[e]] for e in self._succ[self._index[node]])
+
+    def predecessors(self, node) -> Iterator[Any]:
+        return (self._nodes[self._src[e]] for e in self._pred[self._index[node]])
+
+    def out_edges(self, node, data: bool = False) -> List[Tuple[Any, ...]]:
+        return [
+            (
+                (node, self._nodes[self._dst[e]], self._edge_attr(e))
+                if data
+                else (node, self._nodes[self._dst[e]])
+            )
+            for e in self._succ[self._index[node]]
+        ]
+
+    def in_edges(self, node, data: bool = False) -> List[Tuple[Any, ...]]:
+        return [
+            (
+                (self._nodes[self._src[e]], node, self._edge_attr(e))
+                if data
+                else (self._nodes[self._src[e]], node)
+            )
+            for e in self._pred[self._index[node]]
+        ]
+
+    def subgraph(self, nodes: Iterable[Any]) -> "CompactDiGraph":
+        """
+        Unlike DiGraph.subgraph, this returns a copy instead of a view.
+        """
+        keep = {self._index[n] for n in nodes if n in self._index}
+        sub = CompactDiGraph()
+        sub.graph.update(self.graph)
+        for i in self._iter_node_ids():
+            if i in keep:
+                sub.add_node(self._nodes[i], **self._node_attr(i))
+        for i in self._iter_node_ids():
+            if i in keep:
+                for e in self._succ[i]:
+                    if self._dst[e] in keep:
+                        sub.add_edge(
+                            self._nodes[i],
+                            self._nodes[self._dst[e]],
+                            **self._edge_attr(e),
+                        )
+        return sub
+
+    def copy(self) -> "CompactDiGraph":
+        return self.subgraph(self._iter_nodes())
+
+    def to_networkx(self) -> DiGraph:
+        g = DiGraph()
+        g.graph.update(self.graph)
+        g.add_nodes_from(self.nodes(data=True))
+        g.add_edges_from(self.edges(data=True))
+        return g
+
+    @staticmethod
+    def from_networkx(graph: DiGraph) -> "CompactDiGraph":
+        g = CompactDiGraph()
+        g.graph.update(graph.graph)
+        g.add_nodes_from(graph.nodes(data=True))
+        g.add_edges_from(graph.edges(data=True))
+        return g
+
+
+def new_graph(backend: Optional[str] = None) -> Any:
+    """
+    :param backend: "networkx" or "compact", default to SQLLINEAGE_GRAPH_BACKEND environment variable
+    :return: an empty graph of the backend
+    """
+    backend = backend or GRAPH_BACKEND
+    if backend == COMPACT_BACKEND:
+        return CompactDiGraph()
+    elif backend == NETWORKX_BACKEND:
+        return DiGraph()
+    raise ValueError(f"Unknown graph backend: {backend}")
+
+
+def to_networkx(graph: Any) -> DiGraph:
+    """
+    :param graph: a graph of any backend
+    :return: graph itself if it's already a networkx DiGraph, otherwise the converted DiGraph
+    """
+    return graph.to_networkx() if isinstance(graph, CompactDiGraph) else graph
@@ -1,38 +1,157 @@
 import itertools
-from typing import List, Set, Tuple, Union
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import networkx as nx
 from networkx import DiGraph
 
+from sqllineage.core.graph import new_graph
 from sqllineage.core.models import Column, Path, SubQuery, Table
 from sqllineage.utils.constant import EdgeTag, EdgeType, NodeTag
 
 DATASET_CLASSES = (Path, Table)
 
 
+def merge_graph(g: DiGraph, h: DiGraph) -> None:
+    """
+    In-place equivalent of g = nx.compose(g, h): nodes and edges of h are added to g, with attributes from h taking
+    precedence. Unlike compose, g isn't copied, so the cost is proportional to the size of h only.
+    """
+    g.graph.update(h.graph)
+    g.add_nodes_from(h.nodes(data=True))
+    g.add_edges_from(h.edges(data=True))
+
+
+def rename_node(g: DiGraph, old: Any, new: Any) -> None:
+    """
+    In-place equivalent of g = nx.relabel_nodes(g, {old: new}): edges of old, including HAS_COLUMN edges to its
+    columns, are moved over to new, then old is removed. Only edges of old are touched instead of copying whole graph.
+    If new is already in the graph, its attributes are kept.
+    """
+    if old == new:
+        return
+    if not g.has_node(new):
+        g.add_node(new, **g.nodes[old])
+    out_edges = [
+        (new, new if tgt == old else tgt, attr)
+        for _, tgt, attr in g.out_edges(old, data=True)
+    ]
+    in_edges = [
+        (src, new, attr) for src, _, attr in g.in_edges(old, data=True) if src != old
+    ]
+    g.remove_node(old)
+    g.add_edges_from(out_edges)
+    g.add_edges_from(in_edges)
+
+
 class ColumnLineageMixin:
-    def get_column_lineage(self, exclude_subquery=True) -> Set[Tuple[Column, ...]]:
+    def _column_lineage_endpoints(
+        self, exclude_subquery: bool
+    ) -> Tuple[Dict[Column, List[Column]], Set[Column], Set[Column]]:
+        """
+        :return: successors of each column, source columns and target columns
+        """
         self.graph: DiGraph  # For mypy attribute checking
-        # filter all the column node in the graph
-        column_nodes = [n for n in self.graph.nodes if isinstance(n, Column)]
-        column_graph = self.graph.subgraph(column_nodes)
-        source_columns = {column for column, deg in column_graph.in_degree if deg == 0}
-        # if a column lineage path ends at SubQuery, then it should be pruned
-        target_columns = {
-            node
-            for node, deg in column_graph.out_degree
-            if isinstance(node, Column) and deg == 0
+        # filter all the column node in the graph. column only points to column, no need to check successors' type
+        successors = {
+            n: list(self.graph.successors(n))
+            for n in self.graph.nodes
+            if isinstance(n, Column)
         }
+        has_predecessor = {n for succ in successors.values() for n in succ}
+        source_columns = {n for n in successors if n not in has_predecessor}
+        # if a column lineage path ends at SubQuery, then it should be pruned
+        target_columns = {n for n, succ in successors.items() if len(succ) == 0}
         if exclude_subquery:
             target_columns = {
                 node for node in target_columns if isinstance(node.parent, Table)
             }
-        columns = set()
-        for source, target in itertools.product(source_columns, target_columns):
-            simple_paths = list(nx.all_simple_paths(self.graph, source, target))
-            for path in simple_paths:
-                columns.add(tuple(path))
-        return columns
+        return successors, source_columns, target_columns
+
+    def iter_column_lineage(
+        self, exclude_subquery: bool = True
+    ) -> Iterator[Tuple[Column, ...]]:
+        """
+        Yield column lineage paths one by one, without materializing all of them.
+
+        Each source column is visited with one depth-first search, which follows only simple paths like
+        nx.all_simple_paths does, so it's safe even when column lineage contains cycle. A column without any lineage
+        edge makes no path, whatever networkx version is installed.
+        """
+        successors, source_columns, target_columns = self._column_lineage_endpoints(
+            exclude_subquery
+        )
+        for source in source_columns:
+            path = [source]
+            on_path = {source}
+            stack = [iter(successors[source])]
+            while stack:
+                child = next(stack[-1], None)
+                if child is None:
+                    stack.pop()
+                    on_path.discard(path.pop())
+                elif child in on_path:
+                    continue
+                elif child in target_columns:
+                    # target column has no successor, path ends here
+                    yield tuple(path) + (child,)
+                else:
+                    path.append(child)
+                    on_path.add(child)
+                    stack.append(iter(successors[child]))
+
+    def get_column_lineage_endpoints(
+        self, exclude_subquery: bool = True
+    ) -> Set[Tuple[Column, Column]]:
+        """
+        (source column, target column) pairs, the same as first and last column of each path from
+        get_column_lineage, but computed by a breadth-first search per source column without building paths.
+        """
+        successors, source_columns, target_columns = self._column_lineage_endpoints(
+            exclude_subquery
+        )
+        endpoints = set()
+        for source in source_columns:
+            visited = {source}
+            queue = deque([source])
+            while queue:
+                node = queue.popleft()
+                if node in target_columns and node != source:
+                    endpoints.add((source, node))
+                for child in successors[node]:
+                    if child not in visited:
+                        visited.add(child)
+                        queue.append(child)
+        return endpoints
+
+    def get_column_lineage(self, exclude_subquery=True) -> Set[Tuple[Column, ...]]:
+        """
+        All the column lineage paths from source columns to target columns. A column without any lineage edge is both
+        source and target, but makes no path: nx.all_simple_paths used to return none for it before networkx 3.3,
+        and networkx>=2.4 is still supported.
+        """
+        successors, source_columns, target_columns = self._column_lineage_endpoints(
+            exclude_subquery
+        )
+        column_graph = nx.DiGraph(successors)
+        if not nx.is_directed_acyclic_graph(column_graph):
+            return set(self.iter_column_lineage(exclude_subquery))
+        # without cycle, every path is simple. Visit columns from downstream to upstream so that
+        # paths to target columns are computed once per column and shared by all of its upstream columns
+        suffixes: Dict[Column, List[Tuple[Column, ...]]] = {}
+        for node in reversed(list(nx.topological_sort(column_graph))):
+            paths: List[Tuple[Column, ...]] = (
+                [(node,)] if node in target_columns else []
+            )
+            for child in successors[node]:
+                paths.extend((node,) + suffix for suffix in suffixes[child])
+            suffixes[node] = paths
+        return {
+            path
+            for source in source_columns
+            for path in suffixes[source]
+            if len(path) > 1
+        }
 
 
 class SubQueryLineageHolder(ColumnLineageMixin):
@@ -46,19 +165,43 @@ class SubQueryLineageHolder(ColumnLineageMixin):
     This is the most atomic representation of lineage result.
     """
 
+    _indexed_tags = (NodeTag.READ, NodeTag.WRITE, NodeTag.CTE, NodeTag.DROP)
+
     def __init__(self) -> None:
-        self.graph = nx.DiGraph()
+        self.graph = new_graph()
         self.extra_subqueries: Set[SubQuery] = set()
 
+    @property
+    def graph(self) -> DiGraph:
+        return self._graph
+
+    @graph.setter
+    def graph(self, graph: DiGraph) -> None:
+        # read/write/cte/drop are looked up repeatedly by extractors, keep an index per tag instead of scanning nodes.
+        # a graph assigned from outside is indexed once here, add_* and merge keep the index up to date afterwards
+        self._graph = graph
+        self._tag_index: Dict[str, Set[Any]] = {
+            tag: set() for tag in self._indexed_tags
+        }
+        for node, attr in graph.nodes(data=True):
+            for tag in self._indexed_tags:
+                if attr.get(tag) is True:
+                    self._tag_index[tag].add(node)
+
     def __or__(self, other):
-        self.graph = nx.compose(self.graph, other.graph)
+        # merge in place: holder |= subquery_holder is called for every subquery, CTE and union branch, copying the
+        # growing graph each time would make nesting depth multiply the cost
+        merge_graph(self.graph, other.graph)
+        for tag, nodes in other._tag_index.items():
+            self._tag_index[tag].update(nodes)
         return self
 
     def _property_getter(self, prop) -> Set[Union[SubQuery, Table]]:
-        return {t for t, attr in self.graph.nodes(data=True) if attr.get(prop) is True}
+        return set(self._tag_index[prop])
 
     def _property_setter(self, value, prop) -> None:
         self.graph.add_node(value, **{prop: True})
+        self._tag_index[prop].add(value)
 
     @property
     def read(self) -> Set[Union[SubQuery, Table]]:
@@ -183,36 +326,61 @@ class SQLLineageHolder(ColumnLineageMixin):
         :param graph: the Directed Acyclic Graph holding all the combined lineage result.
         """
         self.graph = graph
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached table/column views and degree maps.
+
+        They are computed once on first access, call this after mutating the graph in place.
+        """
         self._selfloop_tables = self.__retrieve_tag_tables(NodeTag.SELFLOOP)
         self._sourceonly_tables = self.__retrieve_tag_tables(NodeTag.SOURCE_ONLY)
         self._targetonly_tables = self.__retrieve_tag_tables(NodeTag.TARGET_ONLY)
+        self._table_lineage_graph: Optional[DiGraph] = None
+        self._column_lineage_graph: Optional[DiGraph] = None
+        self._table_degrees: Optional[Tuple[Dict[Any, int], Dict[Any, int]]] = None
 
     @property
     def table_lineage_graph(self) -> DiGraph:
         """
         The table level DiGraph held by SQLLineageHolder
         """
-        table_nodes = [n for n in self.graph.nodes if isinstance(n, DATASET_CLASSES)]
-        return self.graph.subgraph(table_nodes)
+        if self._table_lineage_graph is None:
+            table_nodes = [
+                n for n in self.graph.nodes if isinstance(n, DATASET_CLASSES)
+            ]
+            self._table_lineage_graph = self.graph.subgraph(table_nodes)
+        return self._table_lineage_graph
 
     @property
     def column_lineage_graph(self) -> DiGraph:
         """
         The column level DiGraph held by SQLLineageHolder
         """
-        column_nodes = [n for n in self.graph.nodes if isinstance(n, Column)]
-        return self.graph.subgraph(column_nodes)
+        if self._column_lineage_graph is None:
+            column_nodes = [n for n in self.graph.nodes if isinstance(n, Column)]
+            self._column_lineage_graph = self.graph.subgraph(column_nodes)
+        return self._column_lineage_graph
+
+    @property
+    def _table_in_out_degree(self) -> Tuple[Dict[Any, int], Dict[Any, int]]:
+        if self._table_degrees is None:
+            g = self.table_lineage_graph
+            self._table_degrees = dict(g.in_degree), dict(g.out_degree)
+        return self._table_degrees
 
     @property
     def source_tables(self) -> Set[Table]:
         """
         a list of source :class:`sqllineage.models.Table`
         """
+        in_degree, out_degree = self._table_in_out_degree
         source_tables = {
-            table for table, deg in self.table_lineage_graph.in_degree if deg == 0
-        }.intersection(
-            {table for table, deg in self.table_lineage_graph.out_degree if deg > 0}
-        )
+            table
+            for table, deg in in_degree.items()
+            if deg == 0 and out_degree[table] > 0
+        }
         source_tables |= self._selfloop_tables
         source_tables |= self._sourceonly_tables
         return source_tables
@@ -222,11 +390,12 @@ class SQLLineageHolder(ColumnLineageMixin):
         """
         a list of target :class:`sqllineage.models.Table`
         """
+        in_degree, out_degree = self._table_in_out_degree
         target_tables = {
-            table for table, deg in self.table_lineage_graph.out_degree if deg == 0
-        }.intersection(
-            {table for table, deg in self.table_lineage_graph.in_degree if deg > 0}
-        )
+            table
+            for table, deg in out_degree.items()
+            if deg == 0 and in_degree[table] > 0
+        }
         target_tables |= self._selfloop_tables
         target_tables |= self._targetonly_tables
         return target_tables
@@ -236,12 +405,13 @@ class SQLLineageHolder(ColumnLineageMixin):
         """
         a list of intermediate :class:`sqllineage.models.Table`
         """
+        in_degree, out_degree = self._table_in_out_degree
         intermediate_tables = {
-            table for table, deg in self.table_lineage_graph.in_degree if deg > 0
-        }.intersection(
-            {table for table, deg in self.table_lineage_graph.out_degree if deg > 0}
-        )
-        intermediate_tables -= self.__retrieve_tag_tables(NodeTag.SELFLOOP)
+            table
+            for table, deg in in_degree.items()
+            if deg > 0 and out_degree[table] > 0
+        }
+        intermediate_tables -= self._selfloop_tables
         return intermediate_tables
 
     def __retrieve_tag_tables(self, tag) -> Set[Union[Path, Table]]:
@@ -252,21 +422,21 @@ class SQLLineageHolder(ColumnLineageMixin):
         }
 
     @staticmethod
-    def _build_digraph(*args: StatementLineageHolder) -> DiGraph:
+    def _build_digraph(holders: Iterable[StatementLineageHolder]) -> DiGraph:
         """
         To assemble multiple :class:`sqllineage.holders.StatementLineageHolder` into
         :class:`sqllineage.holders.SQLLineageHolder`
         """
-        g = DiGraph()
-        for holder in args:
-            g = nx.compose(g, holder.graph)
+        g = new_graph()
+        for holder in holders:
+            merge_graph(g, holder.graph)
             if holder.drop:
                 for table in holder.drop:
                     if g.has_node(table) and g.degree[table] == 0:
                         g.remove_node(table)
             elif holder.rename:
                 for table_old, table_new in holder.rename:
-                    g = nx.relabel_nodes(g, {table_old: table_new})
+                    rename_node(g, table_old, table_new)
                     g.remove_edge(table_new, table_new)
                     if g.degree[table_new] == 0:
                         g.remove_node(table_new)
@@ -274,22 +444,17 @@ class SQLLineageHolder(ColumnLineageMixin):
                 read, write = holder.read, holder.write
                 if len(read) > 0 and len(write) == 0:
                     # source only table comes from SELECT statement
-                    nx.set_node_attributes(
-                        g, {table: True for table in read}, NodeTag.SOURCE_ONLY
-                    )
+                    for table in read:
+                        g.add_node(table, **{NodeTag.SOURCE_ONLY: True})
                 elif len(read) == 0 and len(write) > 0:
                     # target only table comes from case like: 1) INSERT/UPDATE constant values; 2) CREATE TABLE
-                    nx.set_node_attributes(
-                        g, {table: True for table in write}, NodeTag.TARGET_ONLY
-                    )
+                    for table in write:
+                        g.add_node(table, **{NodeTag.TARGET_ONLY: True})
                 else:
                     for source, target in itertools.product(read, write):
                         g.add_edge(source, target, type=EdgeType.LINEAGE)
-        nx.set_node_attributes(
-            g,
-            {table: True for table in {e[0] for e in nx.selfloop_edges(g)}},
-            NodeTag.SELFLOOP,
-        )
+        for table in [n for n in g.nodes if g.has_edge(n, n)]:
+            g.add_node(table, **{NodeTag.SELFLOOP: True})
         # find all the columns that we can't assign accurately to a parent table (with multiple parent candidates)
         unresolved_cols = [
             (s, t)
@@ -319,5 +484,14 @@ class SQLLineageHolder(ColumnLineageMixin):
         To assemble multiple :class:`sqllineage.holders.StatementLineageHolder` into
         :class:`sqllineage.holders.SQLLineageHolder`
         """
-        g = SQLLineageHolder._build_digraph(*args)
+        g = SQLLineageHolder._build_digraph(args)
+        return SQLLineageHolder(g)
+
+    @staticmethod
+    def of_iterable(holders: Iterable[StatementLineageHolder]) -> "SQLLineageHolder":
+        """
+        Same as :meth:`of`, except holders are consumed one at a time, so that a lazy iterable never needs to be
+        held in memory as a whole
+        """
+        g = SQLLineageHolder._build_digraph(holders)
         return SQLLineageHolder(g)
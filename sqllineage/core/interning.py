@@ -0,0 +1,123 @@
+"""
+Interning of lineage models, so that equal Schema, Table, Path and Column share one canonical instance.
+
+Analyzing a large query log builds the same tables and columns over and over again, each one a distinct object with
+its own attributes. Once a statement is analyzed, its graph no longer changes, so its nodes can be swapped for
+canonical instances. The registry only holds weak references: a canonical instance is gone as soon as no lineage
+result refers to it anymore.
+
+Interning is opt-in, see the intern parameter of :class:`sqllineage.runner.LineageRunner`.
+"""
+
+import copy
+import threading
+import weakref
+from typing import Any, Dict, MutableMapping, NamedTuple, Optional, Tuple, TypeVar
+
+from networkx import DiGraph
+
+from sqllineage.core.models import Column, Path, Schema, Table
+
+T = TypeVar("T")
+
+
+class InternStats(NamedTuple):
+    lookups: int
+    collapsed: int
+    size: int
+
+
+class InternRegistry:
+    """
+    Thread-safe registry of canonical model instances, keyed by type and qualified name
+    """
+
+    def __init__(self) -> None:
+        self._registry: MutableMapping[
+            Tuple[type, str], Any
+        ] = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self._lookups = 0
+        self._collapsed = 0
+
+    def intern(self, obj: T) -> T:
+        """
+        :param obj: a lineage model, anything else is returned as is
+        :return: the canonical instance equal to obj
+        """
+        canonical_part: Any = None
+        if isinstance(obj, Table):
+            canonical_part = self.intern(obj.schema)
+        elif isinstance(obj, Column):
+            parent = obj.parent
+            if not isinstance(parent, Table):
+                # a column without a single parent table is equal to other columns with the same name, regardless of
+                # its parent candidates, subquery or path. Collapsing it would lose them.
+                return obj
+            canonical_part = self.intern(parent)
+        elif not isinstance(obj, (Schema, Path)):
+            return obj
+        key = (type(obj), str(obj))
+        with self._lock:
+            self._lookups += 1
+            canonical: Optional[T] = self._registry.get(key)
+            if canonical is None:
+                canonical = self._with_part(obj, canonical_part)
+                self._registry[key] = canonical
+            else:
+                self._collapsed += 1
+            return canonical
+
+    @staticmethod
+    def _with_part(obj: T, part: Any) -> T:
+        """
+        :return: obj if it already refers to the canonical schema or parent table, otherwise a copy of obj referring
+            to it. obj itself is never modified, it may still be shared with other graphs, e.g. the lineage cache.
+        """
+        if isinstance(obj, Table) and obj.schema is not part:
+            table = copy.copy(obj)
+            table.schema = part
+            return table
+        if isinstance(obj, Column) and obj.parent is not part:
+            column = copy.copy(obj)
+            # the copy shares the parent set of obj, give it its own before setting the parent
+            column._parent = set()
+            column.parent = part
+            return column
+        return obj
+
+    def intern_graph(self, graph: DiGraph) -> DiGraph:
+        """
+        Build a copy of graph with every node replaced by its canonical instance.
+
+        :param graph: a lineage graph which is no longer mutated
+        """
+        canonical: Dict[Any, Any] = {n: self.intern(n) for n in graph.nodes}
+        interned = type(graph)()
+        interned.graph.update(graph.graph)
+        interned.add_nodes_from(
+            (canonical[n], attr) for n, attr in graph.nodes(data=True)
+        )
+        interned.add_edges_from(
+            (canonical[u], canonical[v], attr) for u, v, attr in graph.edges(data=True)
+        )
+        return interned
+
+    def clear(self) -> None:
+        """
+        Forget all the canonical instances and reset the stats
+        """
+        with self._lock:
+            self._registry.clear()
+            self._lookups = self._collapsed = 0
+
+    def stats(self) -> InternStats:
+        """
+        :return: lookups made, how many of them collapsed a duplicate into a canonical instance, and number of
+            canonical instances still alive
+        """
+        with self._lock:
+            return InternStats(self._lookups, self._collapsed, len(self._registry))
+
+
+intern_registry = InternRegistry()
@@ -10,6 +10,10 @@ class Schema:
     Data Class for Schema
     """
 
+    # models are hashed constantly as graph node keys, so the string form is computed once and reused for hashing,
+    # equality and printing. hash value is not pickled since string hash is randomized per process.
+    __slots__ = ("_raw_name", "_str", "_hash", "__weakref__")
+
     unknown = "<default>"
 
     def __init__(self, name: str = unknown):
@@ -18,20 +22,36 @@ class Schema:
         """
         self.raw_name = escape_identifier_name(name)
 
+    @property
+    def raw_name(self) -> str:
+        return self._raw_name
+
+    @raw_name.setter
+    def raw_name(self, value: str) -> None:
+        self._raw_name = value
+        self._str = value.lower()
+        self._hash = hash(self._str)
+
+    def __getstate__(self):
+        return (self._raw_name,)
+
+    def __setstate__(self, state):
+        (self.raw_name,) = state
+
     def __str__(self):
-        return self.raw_name.lower()
+        return self._str
 
     def __repr__(self):
         return "Schema: " + str(self)
 
     def __eq__(self, other):
-        return isinstance(other, Schema) and str(self) == str(other)
+        return isinstance(other, Schema) and self._str == other._str
 
     def __hash__(self):
-        return hash(str(self))
+        return self._hash
 
     def __bool__(self):
-        return str(self) != self.unknown
+        return self._str != self.unknown
 
 
 class Table:
@@ -39,36 +59,66 @@ class Table:
     Data Class for Table
     """
 
+    __slots__ = ("_schema", "_raw_name", "alias", "_str", "_hash", "__weakref__")
+
     def __init__(self, name: str, schema: Schema = Schema(), **kwargs):
         """
         :param name: table name
         :param schema: schema as defined by :class:`Schema`
         """
         if "." not in name:
-            self.schema = schema
+            self._schema = schema
             self.raw_name = escape_identifier_name(name)
         else:
             schema_name, table_name = name.rsplit(".", 1)
             if len(schema_name.split(".")) > 2:
                 # allow db.schema as schema_name, but a.b.c as schema_name is forbidden
                 raise SQLLineageException("Invalid format for table name: %s.", name)
-            self.schema = Schema(schema_name)
+            self._schema = Schema(schema_name)
             self.raw_name = escape_identifier_name(table_name)
             if schema:
                 warnings.warn("Name is in schema.table format, schema param is ignored")
         self.alias = kwargs.pop("alias", self.raw_name)
 
+    def _refresh(self) -> None:
+        self._str = f"{self._schema}.{self._raw_name.lower()}"
+        self._hash = hash(self._str)
+
+    @property
+    def schema(self) -> Schema:
+        return self._schema
+
+    @schema.setter
+    def schema(self, value: Schema) -> None:
+        self._schema = value
+        self._refresh()
+
+    @property
+    def raw_name(self) -> str:
+        return self._raw_name
+
+    @raw_name.setter
+    def raw_name(self, value: str) -> None:
+        self._raw_name = value
+        self._refresh()
+
+    def __getstate__(self):
+        return self._schema, self._raw_name, self.alias
+
+    def __setstate__(self, state):
+        self._schema, self.raw_name, self.alias = state
+
     def __str__(self):
-        return f"{self.schema}.{self.raw_name.lower()}"
+        return self._str
 
     def __repr__(self):
         return "Table: " + str(self)
 
     def __eq__(self, other):
-        return isinstance(other, Table) and str(self) == str(other)
+        return isinstance(other, Table) and self._str == other._str
 
     def __hash__(self):
-        return hash(str(self))
+        return self._hash
 
     @staticmethod
     def of(table: Any) -> "Table":
@@ -80,23 +130,40 @@ class Path:
     Data Class for Path
     """
 
+    __slots__ = ("_uri", "_hash", "__weakref__")
+
     def __init__(self, uri: str):
         """
         :param uri: uri of the path
         """
         self.uri = escape_identifier_name(uri)
 
+    @property
+    def uri(self) -> str:
+        return self._uri
+
+    @uri.setter
+    def uri(self, value: str) -> None:
+        self._uri = value
+        self._hash = hash(value)
+
+    def __getstate__(self):
+        return (self._uri,)
+
+    def __setstate__(self, state):
+        (self.uri,) = state
+
     def __str__(self):
-        return self.uri
+        return self._uri
 
     def __repr__(self):
         return "Path: " + str(self)
 
     def __eq__(self, other):
-        return isinstance(other, Path) and self.uri == other.uri
+        return isinstance(other, Path) and self._uri == other._uri
 
     def __hash__(self):
-        return hash(self.uri)
+        return self._hash
 
 
 class SubQuery:
@@ -125,6 +192,12 @@ class SubQuery:
     def __hash__(self):
         return hash(self.query_raw)
 
+    def __getstate__(self):
+        # parse tree is only needed during analyzing, no need to carry it when lineage result is pickled
+        state = self.__dict__.copy()
+        state["query"] = None
+        return state
+
     @staticmethod
     def of(subquery: Any, alias: Optional[str]) -> "SubQuery":
         raise NotImplementedError
@@ -135,6 +208,15 @@ class Column:
     Data Class for Column
     """
 
+    __slots__ = (
+        "_parent",
+        "_raw_name",
+        "source_columns",
+        "_str",
+        "_hash",
+        "__weakref__",
+    )
+
     def __init__(self, name: str, **kwargs):
         """
         :param name: column name
@@ -145,29 +227,51 @@ class Column:
         self.raw_name = escape_identifier_name(name)
         self.source_columns = kwargs.pop("source_columns", ((self.raw_name, None),))
 
-    def __str__(self):
-        return (
-            f"{self.parent}.{self.raw_name.lower()}"
-            if self.parent is not None and not isinstance(self.parent, Path)
-            else f"{self.raw_name.lower()}"
+    def _refresh(self) -> None:
+        # the key depends on parent, so it is recomputed whenever a parent candidate is added
+        parent = self.parent
+        self._str = (
+            f"{parent}.{self._raw_name.lower()}"
+            if parent is not None and not isinstance(parent, Path)
+            else f"{self._raw_name.lower()}"
         )
+        self._hash = hash(self._str)
+
+    @property
+    def raw_name(self) -> str:
+        return self._raw_name
+
+    @raw_name.setter
+    def raw_name(self, value: str) -> None:
+        self._raw_name = value
+        self._refresh()
+
+    def __getstate__(self):
+        return self._parent, self._raw_name, self.source_columns
+
+    def __setstate__(self, state):
+        self._parent, self.raw_name, self.source_columns = state
+
+    def __str__(self):
+        return self._str
 
     def __repr__(self):
         return "Column: " + str(self)
 
     def __eq__(self, other):
-        return isinstance(other, Column) and str(self) == str(other)
+        return isinstance(other, Column) and self._str == other._str
 
     def __hash__(self):
-        return hash(str(self))
+        return self._hash
 
     @property
     def parent(self) -> Optional[Union[Path, Table, SubQuery]]:
-        return list(self._parent)[0] if len(self._parent) == 1 else None
+        return next(iter(self._parent)) if len(self._parent) == 1 else None
 
     @parent.setter
     def parent(self, value: Union[Path, Table, SubQuery]):
         self._parent.add(value)
+        self._refresh()
 
     @property
     def parent_candidates(self) -> List[Union[Path, Table, SubQuery]]:
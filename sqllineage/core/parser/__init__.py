@@ -1,4 +1,4 @@
-from typing import Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from sqllineage.core.holders import SubQueryLineageHolder
 from sqllineage.core.models import Column, Path, SubQuery, Table
@@ -15,6 +15,7 @@ class SourceHandlerMixin:
         for i, tbl in enumerate(self.tables):
             holder.add_read(tbl)
         self.union_barriers.append((len(self.columns), len(self.tables)))
+        alias_index = self.get_alias_index(holder)
         for i, (col_barrier, tbl_barrier) in enumerate(self.union_barriers):
             prev_col_barrier, prev_tbl_barrier = (
                 (0, 0) if i == 0 else self.union_barriers[i - 1]
@@ -25,12 +26,13 @@ class SourceHandlerMixin:
                 if len(holder.write) > 1:
                     raise SQLLineageException
                 tgt_tbl = list(holder.write)[0]
+                alias_mapping = self.get_alias_mapping_from_table_group(
+                    tbl_grp, holder, alias_index
+                )
                 for idx in range(len(col_grp)):
                     tgt_col = col_grp[idx]
                     tgt_col.parent = tgt_tbl
-                    for src_col in tgt_col.to_source_columns(
-                        self.get_alias_mapping_from_table_group(tbl_grp, holder)
-                    ):
+                    for src_col in tgt_col.to_source_columns(alias_mapping):
                         if len(holder.target_columns) == len(col_grp):
                             # example query: create view test (col3) select col1 as col2 from tab
                             # without target_columns = [col3] information, by default src_col = col1 and tgt_col = col2
@@ -40,22 +42,36 @@ class SourceHandlerMixin:
                             tgt_col = holder.target_columns[idx]
                         holder.add_column_lineage(src_col, tgt_col)
 
+    @classmethod
+    def get_alias_index(
+        cls, holder: SubQueryLineageHolder
+    ) -> Dict[Any, List[Tuple[int, Any, str]]]:
+        """
+        Index the alias edges of the graph by the node they start from, so that looking up the aliases of a table
+        group doesn't go through all the edges again. Each entry keeps the position of the edge in the graph.
+        """
+        alias_index: Dict[Any, List[Tuple[int, Any, str]]] = {}
+        for i, (src, tgt, attr) in enumerate(holder.graph.edges(data=True)):
+            if attr.get("type") == EdgeType.HAS_ALIAS:
+                alias_index.setdefault(src, []).append((i, src, tgt))
+        return alias_index
+
     @classmethod
     def get_alias_mapping_from_table_group(
         cls,
         table_group: List[Union[Path, Table, SubQuery]],
         holder: SubQueryLineageHolder,
+        alias_index: Optional[Dict[Any, List[Tuple[int, Any, str]]]] = None,
     ) -> Dict[str, Union[Path, Table, SubQuery]]:
         """
         A table can be referred to as alias, table name, or database_name.table_name, create the mapping here.
         For SubQuery, it's only alias then.
         """
+        if alias_index is None:
+            alias_index = cls.get_alias_index(holder)
+        alias_edges = {edge for src in table_group for edge in alias_index.get(src, [])}
         return {
-            **{
-                tgt: src
-                for src, tgt, attr in holder.graph.edges(data=True)
-                if attr.get("type") == EdgeType.HAS_ALIAS and src in table_group
-            },
+            **{tgt: src for _, src, tgt in sorted(alias_edges, key=lambda e: e[0])},
             **{
                 table.raw_name: table
                 for table in table_group
@@ -1,20 +1,16 @@
-from sqlfluff.core import Linter
-
 from sqllineage.core.analyzer import LineageAnalyzer
-from sqllineage.core.holders import (
-    StatementLineageHolder,
-    SubQueryLineageHolder,
-)
+from sqllineage.core.holders import StatementLineageHolder
 from sqllineage.core.models import AnalyzerContext
-from sqllineage.core.parser.sqlfluff.extractors.lineage_holder_extractor import (
-    LineageHolderExtractor,
-)
+from sqllineage.core.parser.sqlfluff.extractors import EXTRACTORS
+from sqllineage.core.parser.sqlfluff.linter_pool import linter_pool
+from sqllineage.core.parser.sqlfluff.segment_cache import segment_cache
 from sqllineage.core.parser.sqlfluff.utils import (
     clean_parentheses,
     get_statement_segment,
     is_subquery_statement,
     remove_statement_parentheses,
 )
+from sqllineage.core.profiler import profiler
 from sqllineage.exceptions import (
     InvalidSyntaxException,
     UnsupportedStatementException,
@@ -28,45 +24,35 @@ class SqlFluffLineageAnalyzer(LineageAnalyzer):
         self._dialect = dialect
 
     def analyze(self, sql: str) -> StatementLineageHolder:
-        # remove nested parentheses that sqlfluff cannot parse
-        sql = clean_parentheses(sql)
-        is_sub_query = is_subquery_statement(sql)
-        if is_sub_query:
-            sql = remove_statement_parentheses(sql)
-        linter = Linter(dialect=self._dialect)
-        parsed_string = linter.parse_string(sql)
-        statement_segment = get_statement_segment(parsed_string)
-        extractors = [
-            extractor_cls(self._dialect)
-            for extractor_cls in LineageHolderExtractor.__subclasses__()
-        ]
+        with profiler.stage("clean_parentheses"):
+            # remove nested parentheses that sqlfluff cannot parse
+            sql = clean_parentheses(sql)
+            is_sub_query = is_subquery_statement(sql)
+            if is_sub_query:
+                sql = remove_statement_parentheses(sql)
+        with profiler.stage("parse"):
+            with linter_pool.acquire(self._dialect) as linter:
+                parsed_string = linter.parse_string(sql)
+            statement_segment = get_statement_segment(parsed_string)
         if statement_segment.type == "unparsable":
             raise InvalidSyntaxException(
                 f"This SQL statement is unparsable, please check potential syntax error for SQL:"
                 f"{sql}"
             )
-        else:
-            if any(
-                extractor.can_extract(statement_segment.type)
-                for extractor in extractors
-            ):
-                if "unparsable" in statement_segment.descendant_type_set:
-                    raise InvalidSyntaxException(
-                        f"{statement_segment.type} is partially unparsable, "
-                        f"please check potential syntax error for SQL:"
-                        f"{sql}"
-                    )
-                else:
-                    lineage_holder = SubQueryLineageHolder()
-                    for extractor in extractors:
-                        if extractor.can_extract(statement_segment.type):
-                            lineage_holder = extractor.extract(
-                                statement_segment, AnalyzerContext(), is_sub_query
-                            )
-                            break
-                    return StatementLineageHolder.of(lineage_holder)
-            else:
-                raise UnsupportedStatementException(
-                    f"SQLLineage doesn't support analyzing statement type [{statement_segment.type}] for SQL:"
-                    f"{sql}"
-                )
+        extractor_cls = EXTRACTORS.get(statement_segment.type)
+        if extractor_cls is None:
+            raise UnsupportedStatementException(
+                f"SQLLineage doesn't support analyzing statement type [{statement_segment.type}] for SQL:"
+                f"{sql}"
+            )
+        if "unparsable" in statement_segment.descendant_type_set:
+            raise InvalidSyntaxException(
+                f"{statement_segment.type} is partially unparsable, "
+                f"please check potential syntax error for SQL:"
+                f"{sql}"
+            )
+        with profiler.stage("extract"), segment_cache.scope():
+            lineage_holder = extractor_cls(self._dialect).extract(
+                statement_segment, AnalyzerContext(), is_sub_query
+            )
+        return StatementLineageHolder.of(lineage_holder)
@@ -1,7 +1,27 @@
 import importlib
 import os
 import pkgutil
+from typing import Dict, Type
 
 # import each module so that LineageHolderExtractor's __subclasses__ will work
 for module in pkgutil.iter_modules([os.path.dirname(__file__)]):
     importlib.import_module(__name__ + "." + module.name)
+
+from sqllineage.core.parser.sqlfluff.extractors.lineage_holder_extractor import (  # noqa: E402
+    LineageHolderExtractor,
+)
+
+
+def _register_extractors() -> Dict[str, Type[LineageHolderExtractor]]:
+    """
+    Map each supported statement type to its extractor class, the first extractor declaring a type wins
+    """
+    registry: Dict[str, Type[LineageHolderExtractor]] = {}
+    for extractor_cls in LineageHolderExtractor.__subclasses__():
+        for statement_type in extractor_cls.SUPPORTED_STMT_TYPES:
+            registry.setdefault(statement_type, extractor_cls)
+    return registry
+
+
+# built once at import, so that analyzing a statement is a dict lookup instead of probing every extractor
+EXTRACTORS = _register_extractors()
@@ -6,6 +6,10 @@ from sqlfluff.core.parser import BaseSegment
 
 from sqllineage.core.holders import SubQueryLineageHolder
 from sqllineage.core.models import AnalyzerContext, SubQuery
+from sqllineage.core.parser.sqlfluff.handlers import (
+    CONDITIONAL_SEGMENT_HANDLERS,
+    SEGMENT_HANDLERS,
+)
 from sqllineage.core.parser.sqlfluff.handlers.base import (
     ConditionalSegmentBaseHandler,
     SegmentBaseHandler,
@@ -98,11 +102,10 @@ class LineageHolderExtractor:
         :return: A tuple with a list of SegmentBaseHandler and ConditionalSegmentBaseHandler
         """
         handlers: List[SegmentBaseHandler] = [
-            handler_cls() for handler_cls in SegmentBaseHandler.__subclasses__()
+            handler_cls(self.dialect) for handler_cls in SEGMENT_HANDLERS
         ]
-        conditional_handlers = [
-            handler_cls()
-            for handler_cls in ConditionalSegmentBaseHandler.__subclasses__()
+        conditional_handlers: List[ConditionalSegmentBaseHandler] = [
+            handler_cls(self.dialect) for handler_cls in CONDITIONAL_SEGMENT_HANDLERS
         ]
         return handlers, conditional_handlers
 
@@ -6,3 +6,13 @@ import pkgutil
 # each module the subclass in is imported before calling the hook
 for module in pkgutil.iter_modules([os.path.dirname(__file__)]):
     importlib.import_module(__name__ + "." + module.name)
+
+from sqllineage.core.parser.sqlfluff.handlers.base import (  # noqa: E402
+    ConditionalSegmentBaseHandler,
+    SegmentBaseHandler,
+)
+
+# handler classes are collected once at import. Handlers keep state while going through a statement, so each
+# extraction still instantiates its own handlers from these classes
+SEGMENT_HANDLERS = tuple(SegmentBaseHandler.__subclasses__())
+CONDITIONAL_SEGMENT_HANDLERS = tuple(ConditionalSegmentBaseHandler.__subclasses__())
@@ -30,7 +30,8 @@ class SourceHandler(SourceHandlerMixin, ConditionalSegmentBaseHandler):
     Source table and column handler
     """
 
-    def __init__(self):
+    def __init__(self, dialect: str):
+        super().__init__(dialect)
         self.columns = []
         self.tables = []
         self.union_barriers = []
@@ -86,7 +87,9 @@ class SourceHandler(SourceHandlerMixin, ConditionalSegmentBaseHandler):
         sub_segments = retrieve_segments(segment)
         for sub_segment in sub_segments:
             if sub_segment.type == "select_clause_element":
-                self.columns.append(SqlFluffColumn.of(sub_segment))
+                self.columns.append(
+                    SqlFluffColumn.of(sub_segment, dialect=self.dialect)
+                )
 
     def _handle_union(self, segment: BaseSegment) -> None:
         """
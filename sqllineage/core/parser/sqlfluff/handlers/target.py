@@ -21,7 +21,8 @@ class TargetHandler(ConditionalSegmentBaseHandler):
     Target table handler
     """
 
-    def __init__(self) -> None:
+    def __init__(self, dialect: str) -> None:
+        super().__init__(dialect)
         self.indicator = False
         self.prev_token_read = False
         self.prev_token_from = False
@@ -149,5 +150,8 @@ class TargetHandler(ConditionalSegmentBaseHandler):
             ):
                 # target columns only apply to bracketed column references
                 holder.add_target_column(
-                    *[SqlFluffColumn.of(sub_segment) for sub_segment in sub_segments]
+                    *[
+                        SqlFluffColumn.of(sub_segment, dialect=self.dialect)
+                        for sub_segment in sub_segments
+                    ]
                 )
@@ -0,0 +1,81 @@
+"""
+A process-wide pool of sqlfluff Linter, keyed by dialect.
+
+Building a `sqlfluff.core.Linter` resolves dialect, config and templater each time, which costs more than parsing
+a short statement. Linters are therefore kept idle in the pool after use and handed out again for the same dialect.
+Each linter is only ever used by one thread at a time: acquire() takes it out of the pool and returns it on exit.
+"""
+
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import DefaultDict, Dict, Iterator, List
+
+from sqlfluff.core import Linter
+
+DEFAULT_POOL_SIZE = 4
+
+
+class LinterPool:
+    """
+    Thread-safe pool of idle sqlfluff Linter per dialect
+    """
+
+    def __init__(self, max_size: int = DEFAULT_POOL_SIZE):
+        """
+        :param max_size: maximum number of idle linters kept for each dialect
+        """
+        self.max_size = max_size
+        self._idle: DefaultDict[str, List[Linter]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self, dialect: str) -> Iterator[Linter]:
+        """
+        Borrow a linter for the given dialect, building a new one only when none is idle.
+        The linter goes back to the pool on exit, unless the pool for that dialect is already full.
+        """
+        with self._lock:
+            idle = self._idle[dialect]
+            linter = idle.pop() if idle else None
+        if linter is None:
+            linter = Linter(dialect=dialect)
+        try:
+            yield linter
+        finally:
+            with self._lock:
+                idle = self._idle[dialect]
+                if len(idle) < self.max_size:
+                    idle.append(linter)
+
+    def warm_up(self, *dialects: str, size: int = 1) -> None:
+        """
+        Build linters ahead of time so that the first statements don't pay for construction.
+
+        :param dialects: dialects to warm up
+        :param size: number of idle linters to have for each dialect, capped by max_size
+        """
+        for dialect in dialects:
+            with self._lock:
+                missing = min(size, self.max_size) - len(self._idle[dialect])
+            linters = [Linter(dialect=dialect) for _ in range(missing)]
+            with self._lock:
+                idle = self._idle[dialect]
+                idle.extend(linters[: self.max_size - len(idle)])
+
+    def clear(self) -> None:
+        """
+        Drop all the idle linters
+        """
+        with self._lock:
+            self._idle.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: number of idle linters per dialect
+        """
+        with self._lock:
+            return {dialect: len(idle) for dialect, idle in self._idle.items()}
+
+
+linter_pool = LinterPool()
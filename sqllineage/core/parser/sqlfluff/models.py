@@ -3,8 +3,7 @@ from typing import Optional, Tuple
 
 from sqlfluff.core.parser import BaseSegment
 
-from sqllineage import SQLPARSE_DIALECT
-from sqllineage.core.models import Column, Schema, SubQuery, Table
+from sqllineage.core.models import AnalyzerContext, Column, Schema, SubQuery, Table
 from sqllineage.core.parser.sqlfluff.utils import (
     get_identifier,
     is_subquery,
@@ -99,10 +98,14 @@ class SqlFluffColumn(Column):
         """
         Build a 'SqlFluffSubQuery' object
         :param column: column segment
+        :param dialect: dialect the column segment is parsed with, as keyword argument
         :return:
         """
+        dialect: str = kwargs["dialect"]
         if column.type == "select_clause_element":
-            source_columns, alias = SqlFluffColumn._get_column_and_alias(column)
+            source_columns, alias = SqlFluffColumn._get_column_and_alias(
+                column, dialect
+            )
             if alias:
                 return Column(
                     alias,
@@ -120,7 +123,7 @@ class SqlFluffColumn(Column):
                         if len(sub2_segments) == 1:
                             if (sub2_segments[0]).type == "cast_expression":
                                 sub3_segments = retrieve_segments(sub2_segments[0])
-                                if len(retrieve_segments(sub2_segments[0])) == 2:
+                                if len(sub3_segments) == 2:
                                     if (sub3_segments[0]).type == "column_reference":
                                         column_name = get_identifier(sub3_segments[0])
                 return Column(
@@ -129,18 +132,27 @@ class SqlFluffColumn(Column):
                 )
 
         # Wildcard, Case, Function without alias (thus not recognized as an Identifier)
-        source_columns = SqlFluffColumn._extract_source_columns(column)
+        source_columns = SqlFluffColumn._extract_source_columns(column, dialect)
         return Column(
             column.raw,
             source_columns=source_columns,
         )
 
     @staticmethod
-    def _extract_source_columns(segment: BaseSegment) -> List[ColumnQualifierTuple]:
+    def _extract_source_columns(
+        segment: BaseSegment, dialect: str
+    ) -> List[ColumnQualifierTuple]:
         """
         :param segment: segment to be processed
+        :param dialect: dialect the segment is parsed with
         :return: list of extracted source columns
         """
+        if segment.type == "wildcard_expression":
+            # qualified wildcard like tab.* selects all columns of that table
+            parent, column = SqlFluffColumn._get_column_and_parent(
+                retrieve_segments(segment)[0]
+            )
+            return [ColumnQualifierTuple(column, parent)]
         if segment.type == "identifier" or is_wildcard(segment):
             return [ColumnQualifierTuple(segment.raw, None)]
         if segment.type == "column_reference":
@@ -153,62 +165,76 @@ class SqlFluffColumn(Column):
                 if sub_segment.type == "bracketed":
                     if is_subquery(sub_segment):
                         col_list += SqlFluffColumn._get_column_from_subquery(
-                            sub_segment
+                            sub_segment, dialect
                         )
                     else:
                         col_list += SqlFluffColumn._get_column_from_parenthesis(
-                            sub_segment
+                            sub_segment, dialect
                         )
                 elif sub_segment.type in SOURCE_COLUMN_SEGMENT_TYPE or is_wildcard(
                     sub_segment
                 ):
-                    res = SqlFluffColumn._extract_source_columns(sub_segment)
+                    res = SqlFluffColumn._extract_source_columns(sub_segment, dialect)
                     col_list.extend(res)
             return col_list
         return []
 
     @staticmethod
     def _get_column_from_subquery(
-        sub_segment: BaseSegment,
+        sub_segment: BaseSegment, dialect: str
     ) -> List[ColumnQualifierTuple]:
         """
         :param sub_segment: segment to be processed
+        :param dialect: dialect the segment is parsed with
         :return: A list of source columns from a segment
         """
         # This is to avoid circular import
-        from sqllineage.runner import LineageRunner
-
-        src_cols = [
-            lineage[0]
-            for lineage in LineageRunner(
-                sub_segment.raw, dialect=SQLPARSE_DIALECT
-            ).get_column_lineage(exclude_subquery=False)
-        ]
-        source_columns = [
-            ColumnQualifierTuple(
-                src_col.raw_name, src_col.parent.raw_name if src_col.parent else None
+        from sqllineage.core.parser.sqlfluff.extractors.dml_select_extractor import (
+            DmlSelectExtractor,
+        )
+
+        subquery = SqlFluffSubQuery.of(sub_segment, None)
+        holder = DmlSelectExtractor(dialect).extract(
+            sub_segment, AnalyzerContext(subquery)
+        )
+        graph = holder.graph
+        source_columns = []
+        for node in graph.nodes:
+            # source columns are where column lineage paths start
+            if not isinstance(node, Column) or any(
+                isinstance(pred, Column) for pred in graph.predecessors(node)
+            ):
+                continue
+            parent = node.parent
+            if isinstance(parent, SubQuery):
+                # column of a nested subquery selecting no column at all
+                continue
+            source_columns.append(
+                ColumnQualifierTuple(
+                    node.raw_name,
+                    parent.raw_name if isinstance(parent, Table) else None,
+                )
             )
-            for src_col in src_cols
-        ]
         return source_columns
 
     @staticmethod
     def _get_column_from_parenthesis(
-        sub_segment: BaseSegment,
+        sub_segment: BaseSegment, dialect: str
     ) -> List[ColumnQualifierTuple]:
         """
         :param sub_segment: segment to be processed
+        :param dialect: dialect the segment is parsed with
         :return: list of columns and alias from the segment
         """
-        col, _ = SqlFluffColumn._get_column_and_alias(sub_segment)
+        col, _ = SqlFluffColumn._get_column_and_alias(sub_segment, dialect)
         if col:
             return col
-        col, _ = SqlFluffColumn._get_column_and_alias(sub_segment, False)
+        col, _ = SqlFluffColumn._get_column_and_alias(sub_segment, dialect, False)
         return col if col else []
 
     @staticmethod
     def _get_column_and_alias(
-        segment: BaseSegment, check_bracketed: bool = True
+        segment: BaseSegment, dialect: str, check_bracketed: bool = True
     ) -> Tuple[List[ColumnQualifierTuple], Optional[str]]:
         alias = None
         columns = []
@@ -219,7 +245,7 @@ class SqlFluffColumn(Column):
             elif sub_segment.type in SOURCE_COLUMN_SEGMENT_TYPE or is_wildcard(
                 sub_segment
             ):
-                res = SqlFluffColumn._extract_source_columns(sub_segment)
+                res = SqlFluffColumn._extract_source_columns(sub_segment, dialect)
                 columns += res if res else []
 
         return columns, alias
@@ -0,0 +1,67 @@
+"""
+A per-statement cache of segment predicates.
+
+While going through a statement, extractors and handlers ask the same questions about the same segments over and over,
+like whether it is a union or a subquery, and each answer walks the subtree of the segment. Within scope(), the answer
+of a memoized predicate is computed once per segment and reused until the scope exits. Entries are keyed by segment
+identity, and each thread has its own cache.
+"""
+
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar
+
+from sqlfluff.core.parser import BaseSegment
+
+T = TypeVar("T")
+
+
+class SegmentCache:
+    """
+    Thread-local cache of predicate results on sqlfluff segments, alive for the duration of a scope
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def _entries(self) -> Optional[Dict[Tuple[Callable[..., Any], int], Any]]:
+        return getattr(self._local, "entries", None)
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """
+        Cache the memoized predicates until exit. A nested scope shares the cache of the outermost one.
+        """
+        if self._entries() is not None:
+            yield
+            return
+        self._local.entries = {}
+        try:
+            yield
+        finally:
+            self._local.entries = None
+
+    def memoize(self, func: Callable[[BaseSegment], T]) -> Callable[[BaseSegment], T]:
+        """
+        Decorate a predicate on a segment, so that it is computed once per segment within a scope.
+        Outside any scope, the predicate is computed on each call.
+        """
+
+        @wraps(func)
+        def wrapper(segment: BaseSegment) -> T:
+            entries = self._entries()
+            if entries is None:
+                return func(segment)
+            key = (func, id(segment))
+            entry = entries.get(key)
+            if entry is None:
+                # hold the segment along with the result, so that its id cannot be reused by another one in this scope
+                entry = entries[key] = (segment, func(segment))
+            result: T = entry[1]
+            return result
+
+        return wrapper
+
+
+segment_cache = SegmentCache()
@@ -2,13 +2,29 @@
 Utils class to deal with the sqlfluff segments manipulations
 """
 import re
-from typing import Any, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from sqlfluff.core.linter import ParsedString
 from sqlfluff.core.parser import BaseSegment
 
+from sqllineage.core.parser.sqlfluff.segment_cache import segment_cache
 from sqllineage.utils.entities import SubQueryTuple
 
+_STATEMENT_PARENTHESES = re.compile(r"^\((.*)\)")
+# parenthesis, along with the quoted text and comments they might appear in
+_PARENTHESIS = re.compile(
+    r"""
+    '(?:''|\\.|[^'\\])*'
+    |"(?:""|\\.|[^"\\])*"
+    |`(?:``|[^`])*`
+    |--[^\r\n]*
+    |(?<![\w$\#])\#[ ][^\r\n]*
+    |/\*[\s\S]*?\*/
+    |[()]
+    """,
+    re.VERBOSE,
+)
+
 
 def is_segment_negligible(segment: BaseSegment) -> bool:
     """
@@ -49,13 +65,10 @@ def get_subqueries(segment: BaseSegment) -> List[SubQueryTuple]:
     """
     subquery = []
     if segment.type in ["select_clause"]:
-        as_segment = segment.get_child("select_clause_element").get_child(
-            "alias_expression"
-        )
         select_clause = segment.get_child("select_clause_element")
-        case_expression = select_clause.get_child(
-            "expression"
-        ) and select_clause.get_child("expression").get_child("case_expression")
+        as_segment = select_clause.get_child("alias_expression")
+        expression = select_clause.get_child("expression")
+        case_expression = expression and expression.get_child("case_expression")
         target = case_expression or select_clause.get_child("column_reference")
         if target and target.type == "case_expression":
             for when_clause in target.get_children("when_clause"):
@@ -75,9 +88,6 @@ def get_subqueries(segment: BaseSegment) -> List[SubQueryTuple]:
             get_inner_from_expression(segment)
         )
         if is_subquery(target):
-            as_segment, target = extract_as_and_target_segment(
-                get_inner_from_expression(segment)
-            )
             subquery = [
                 SubQueryTuple(
                     get_innermost_bracketed(target) if not is_union(target) else target,
@@ -100,6 +110,7 @@ def get_subqueries(segment: BaseSegment) -> List[SubQueryTuple]:
         raise NotImplementedError()
 
 
+@segment_cache.memoize
 def is_subquery(segment: BaseSegment) -> bool:
     """
     :param segment: segment to be processed
@@ -110,13 +121,11 @@ def is_subquery(segment: BaseSegment) -> bool:
             segment if segment.type == "bracketed" else segment.segments[0]
         )
         # check if innermost parenthesis contains SELECT
+        expression = token.get_child("expression")
         sub_token = (
             token.get_child("select_statement")
             or token.get_child("set_expression")
-            or (
-                token.get_child("expression")
-                and token.get_child("expression").get_child("select_statement")
-            )
+            or (expression and expression.get_child("select_statement"))
         )
         if sub_token is not None:
             return True
@@ -131,13 +140,15 @@ def get_innermost_bracketed(bracketed_segment: BaseSegment) -> BaseSegment:
     # in case of subquery in nested parenthesis, find the innermost one first
     # this should not occur if we clean parentheses like: `SELECT * FROM ((table))`
     while True:
-        sub_bracketed_segments = [
-            bs.get_child("bracketed")
-            for bs in bracketed_segment.segments
-            if bs.get_child("bracketed")
-        ]
-        sub_paren = bracketed_segment.get_child("bracketed") or (
-            sub_bracketed_segments[0] if sub_bracketed_segments else None
+        sub_paren = bracketed_segment.get_child("bracketed") or next(
+            (
+                sub_bracketed
+                for sub_bracketed in (
+                    bs.get_child("bracketed") for bs in bracketed_segment.segments
+                )
+                if sub_bracketed
+            ),
+            None,
         )
         if sub_paren is not None:
             bracketed_segment = sub_paren
@@ -151,9 +162,8 @@ def is_values_clause(segment: BaseSegment) -> bool:
     :param segment: segment to be processed
     :return: True if it is a given segments list o segment contains a 'values_clause' type segment
     """
-    if segment.get_child("table_expression") and segment.get_child(
-        "table_expression"
-    ).get_child("values_clause"):
+    table_expression = segment.get_child("table_expression")
+    if table_expression and table_expression.get_child("values_clause"):
         return True
     return False
 
@@ -173,19 +183,22 @@ def get_inner_from_expression(segment: BaseSegment) -> BaseSegment:
     :param segment: segment to be processed
     :return: a list of segments from a 'from_expression' or 'from_expression_element' segment
     """
-    if segment.get_child("from_expression"):
-        if segment.get_child("from_expression").get_child("from_expression_element"):
-            return segment.get_child("from_expression").get_child(
+    from_expression = segment.get_child("from_expression")
+    if from_expression:
+        from_expression_element = from_expression.get_child("from_expression_element")
+        if from_expression_element:
+            return from_expression_element
+        bracketed = from_expression.get_child("bracketed")
+        if bracketed:
+            from_expression_element = get_innermost_bracketed(bracketed).get_child(
                 "from_expression_element"
             )
-        if segment.get_child("from_expression").get_child("bracketed"):
-            innermost_bracketed = get_innermost_bracketed(
-                segment.get_child("from_expression").get_child("bracketed")
-            )
-            if innermost_bracketed.get_child("from_expression_element"):
-                return innermost_bracketed.get_child("from_expression_element")
-    elif segment.get_child("from_expression_element"):
-        return segment.get_child("from_expression_element")
+            if from_expression_element:
+                return from_expression_element
+    else:
+        from_expression_element = segment.get_child("from_expression_element")
+        if from_expression_element:
+            return from_expression_element
     return segment
 
 
@@ -311,10 +324,11 @@ def is_wildcard(symbol: BaseSegment):
     :param symbol: symbol segment
     :return: True if the symbol segment is a wildcard
     """
-    return (
-        symbol.type == "wildcard_expression"
-        or symbol.type == "symbol"
+    # a binary operator * is a symbol too, tell it apart from the star of count(*) or a select list
+    return symbol.type == "wildcard_expression" or (
+        symbol.type == "symbol"
         and symbol.raw == "*"
+        and not symbol.is_type("binary_operator")
     )
 
 
@@ -365,11 +379,8 @@ def get_grandchild(
     :param grandchild: grand child
     :return: the grandchild segment if found, otherwise, None
     """
-    return (
-        segment.get_child(child).get_child(grandchild)
-        if segment.get_child(child)
-        else None
-    )
+    child_segment = segment.get_child(child)
+    return child_segment.get_child(grandchild) if child_segment else None
 
 
 def get_child(segment: BaseSegment, child: str) -> BaseSegment:
@@ -388,11 +399,8 @@ def get_grandchildren(segment: BaseSegment, child: str, grandchildren: str) -> A
     :param grandchildren: grand children
     :return: the grandchildren segment list if found, otherwise, empty list
     """
-    return (
-        segment.get_child(child).get_children(grandchildren)
-        if segment.get_child(child)
-        else []
-    )
+    child_segment = segment.get_child(child)
+    return child_segment.get_children(grandchildren) if child_segment else []
 
 
 def get_statement_segment(parsed_string: ParsedString) -> BaseSegment:
@@ -411,20 +419,15 @@ def get_statement_segment(parsed_string: ParsedString) -> BaseSegment:
     )
 
 
+@segment_cache.memoize
 def is_union(segment: BaseSegment) -> bool:
     """
     :param segment: segment to be processed
     :return: True if the segment contains 'UNION' or 'UNION ALL' keyword
     """
-    return (
-        len(
-            [
-                s
-                for s in segment.raw_segments
-                if (s.raw_upper == "UNION" or s.raw_upper == "UNION ALL")
-            ]
-        )
-        > 0
+    return any(
+        s.raw_upper == "UNION" or s.raw_upper == "UNION ALL"
+        for s in segment.raw_segments
     )
 
 
@@ -440,13 +443,11 @@ def get_union_subqueries(segment: BaseSegment) -> List[BaseSegment]:
 
 
 def is_subquery_statement(stmt: str) -> bool:
-    parentheses_regex = r"^\(.*\)"
-    return bool(re.match(parentheses_regex, stmt))
+    return bool(_STATEMENT_PARENTHESES.match(stmt))
 
 
 def remove_statement_parentheses(stmt: str) -> str:
-    parentheses_regex = r"^\((.*)\)"
-    return re.sub(parentheses_regex, r"\1", stmt)
+    return _STATEMENT_PARENTHESES.sub(r"\1", stmt)
 
 
 def clean_parentheses(stmt: str) -> str:
@@ -456,10 +457,31 @@ def clean_parentheses(stmt: str) -> str:
       will be:
         `SELECT col1 FROM (SELECT col1 FROM tab1) dt`
 
+      A pair of parentheses is redundant when it immediately wraps another pair. Parentheses are matched in a single
+      pass with a stack, skipping those inside quotes and comments.
+
     :param stmt: a SQL str to be cleaned
     """
-    redundant_parentheses = r"\(\(([^()]+)\)\)"
-    if re.findall(redundant_parentheses, stmt):
-        stmt = re.sub(redundant_parentheses, r"(\1)", stmt)
-        stmt = clean_parentheses(stmt)
-    return stmt
+    if "((" not in stmt:
+        return stmt
+    # position of matching opening parenthesis for each closing one
+    opening: Dict[int, int] = {}
+    stack: List[int] = []
+    for match in _PARENTHESIS.finditer(stmt):
+        char = match.group()
+        if char == "(":
+            stack.append(match.start())
+        elif char == ")" and stack:
+            opening[match.start()] = stack.pop()
+    redundant = set()
+    for close, open_ in opening.items():
+        if opening.get(close - 1) == open_ + 1:
+            redundant.add(open_)
+            redundant.add(close)
+    parts = []
+    start = 0
+    for pos in sorted(redundant):
+        parts.append(stmt[start:pos])
+        start = pos + 1
+    parts.append(stmt[start:])
+    return "".join(parts)
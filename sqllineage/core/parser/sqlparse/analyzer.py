@@ -18,9 +18,9 @@ from sqlparse.sql import (
 from sqllineage.core.analyzer import LineageAnalyzer
 from sqllineage.core.holders import StatementLineageHolder, SubQueryLineageHolder
 from sqllineage.core.models import AnalyzerContext, Column, SubQuery
-from sqllineage.core.parser.sqlparse.handlers.base import (
-    CurrentTokenBaseHandler,
-    NextTokenBaseHandler,
+from sqllineage.core.parser.sqlparse.handlers import (
+    CURRENT_TOKEN_HANDLERS,
+    NEXT_TOKEN_HANDLERS,
 )
 from sqllineage.core.parser.sqlparse.holder_utils import get_dataset_from_identifier
 from sqllineage.core.parser.sqlparse.models import SqlParseSubQuery, SqlParseTable
@@ -29,6 +29,7 @@ from sqllineage.core.parser.sqlparse.utils import (
     is_subquery,
     is_token_negligible,
 )
+from sqllineage.core.profiler import profiler
 from sqllineage.utils.helpers import trim_comment
 
 
@@ -36,8 +37,13 @@ class SqlParseLineageAnalyzer(LineageAnalyzer):
     """SQL Statement Level Lineage Analyzer."""
 
     def analyze(self, sql: str) -> StatementLineageHolder:
-        # get rid of comments, which cause inconsistencies in sqlparse output
-        stmt = sqlparse.parse(trim_comment(sql))[0]
+        with profiler.stage("parse"):
+            # get rid of comments, which cause inconsistencies in sqlparse output
+            stmt = sqlparse.parse(trim_comment(sql))[0]
+        with profiler.stage("extract"):
+            return self._extract(stmt)
+
+    def _extract(self, stmt: Statement) -> StatementLineageHolder:
         if (
             stmt.get_type() == "DELETE"
             or stmt.token_first(skip_cm=True).normalized == "TRUNCATE"
@@ -193,12 +199,8 @@ class SqlParseLineageAnalyzer(LineageAnalyzer):
         if context.subquery is not None:
             # If within subquery, then manually add subquery as target table
             holder.add_write(context.subquery)
-        current_handlers = [
-            handler_cls() for handler_cls in CurrentTokenBaseHandler.__subclasses__()
-        ]
-        next_handlers = [
-            handler_cls() for handler_cls in NextTokenBaseHandler.__subclasses__()
-        ]
+        current_handlers = [handler_cls() for handler_cls in CURRENT_TOKEN_HANDLERS]
+        next_handlers = [handler_cls() for handler_cls in NEXT_TOKEN_HANDLERS]
 
         subqueries = []
         for sub_token in token.tokens:
@@ -6,3 +6,13 @@ import pkgutil
 # each module the subclass in is imported before calling the hook
 for module in pkgutil.iter_modules([os.path.dirname(__file__)]):
     importlib.import_module(__name__ + "." + module.name)
+
+from sqllineage.core.parser.sqlparse.handlers.base import (  # noqa: E402
+    CurrentTokenBaseHandler,
+    NextTokenBaseHandler,
+)
+
+# handler classes are collected once at import. Handlers keep state while going through a statement, so each
+# extraction still instantiates its own handlers from these classes
+CURRENT_TOKEN_HANDLERS = tuple(CurrentTokenBaseHandler.__subclasses__())
+NEXT_TOKEN_HANDLERS = tuple(NextTokenBaseHandler.__subclasses__())
@@ -0,0 +1,237 @@
+"""
+Timing instrumentation of lineage analysis, broken down by stage and by statement.
+
+Stages are the steps a script goes through: split into statements, clean parentheses, parse, extract lineage, look up
+the lineage cache, build the combined graph and compute column lineage. Code running a stage wraps it in
+profiler.stage(); this is a no-op unless a :class:`LineageProfile` is activated in the current thread, which is what
+:class:`sqllineage.runner.LineageRunner` does when created with profile=True.
+
+Time spent in a stage excludes the time of stages nested in it, so that stage timings add up.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import (
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    TypeVar,
+)
+
+from networkx import DiGraph
+
+T = TypeVar("T")
+_EXHAUSTED = object()
+
+
+class StatementProfile(NamedTuple):
+    position: int
+    sql: str
+    seconds: float
+    stages: Dict[str, float]
+    cached: bool
+    nodes: int
+    edges: int
+
+
+class LineageProfile:
+    """
+    Timings collected while analyzing one script, along with lineage cache hits and graph size
+    """
+
+    def __init__(self) -> None:
+        self.stages: DefaultDict[str, float] = defaultdict(float)
+        self.statements: List[StatementProfile] = []
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.nodes = 0
+        self.edges = 0
+
+    @property
+    def total(self) -> float:
+        return sum(self.stages.values())
+
+    def slowest(self, n: int = 10) -> List[StatementProfile]:
+        """
+        :param n: number of statements to return
+        :return: the n statements that took the longest to analyze, slowest first
+        """
+        return sorted(self.statements, key=lambda s: s.seconds, reverse=True)[:n]
+
+    def report(self, top: int = 10) -> str:
+        """
+        :param top: number of slowest statements to list
+        :return: a human readable breakdown of time per stage, followed by the slowest statements
+        """
+        total = self.total
+        lines = [f"{'stage':<20}{'seconds':>12}{'%':>8}"]
+        for stage, seconds in sorted(
+            self.stages.items(), key=lambda kv: kv[1], reverse=True
+        ):
+            share = seconds / total * 100 if total else 0.0
+            lines.append(f"{stage:<20}{seconds:>12.4f}{share:>7.1f}%")
+        lines.append(f"{'total':<20}{total:>12.4f}")
+        lines.append(
+            f"statements: {len(self.statements)}, cache hits: {self.cache_hits}, "
+            f"cache misses: {self.cache_misses}, graph: {self.nodes} nodes, {self.edges} edges"
+        )
+        slowest = self.slowest(top)
+        if slowest:
+            lines.append("slowest statements:")
+            for stmt in slowest:
+                stages = " ".join(
+                    f"{stage}={seconds:.4f}" for stage, seconds in stmt.stages.items()
+                )
+                sql = " ".join(stmt.sql.split())
+                sql = sql if len(sql) <= 80 else sql[:77] + "..."
+                lines.append(
+                    f"  #{stmt.position:<5}{stmt.seconds:>10.4f}s  {stages}{' (cached)' if stmt.cached else ''}"
+                )
+                lines.append(f"         {sql}")
+        return "\n".join(lines)
+
+
+class _Frame:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.start = time.perf_counter()
+        self.nested = 0.0
+
+
+class _Statement:
+    def __init__(self, position: int, sql: str) -> None:
+        self.position = position
+        self.sql = sql
+        self.start = time.perf_counter()
+        self.stages: DefaultDict[str, float] = defaultdict(float)
+        self.cached = False
+        self.nodes = 0
+        self.edges = 0
+
+
+class Profiler:
+    """
+    Thread-local entry point to record into the active :class:`LineageProfile`, if any
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    @property
+    def _profile(self) -> Optional[LineageProfile]:
+        return getattr(self._local, "profile", None)
+
+    @contextmanager
+    def activate(self, profile: Optional[LineageProfile]) -> Iterator[None]:
+        """
+        Record into profile until exit. With profile being None or a profile already active, this is a no-op.
+        """
+        if profile is None or self._profile is not None:
+            yield
+            return
+        self._local.profile = profile
+        self._local.frames = []
+        self._local.statement = None
+        try:
+            yield
+        finally:
+            self._local.profile = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Time the enclosed code as stage name, minus the stages nested in it
+        """
+        profile = self._profile
+        if profile is None:
+            yield
+            return
+        frames: List[_Frame] = self._local.frames
+        frame = _Frame(name)
+        frames.append(frame)
+        try:
+            yield
+        finally:
+            frames.pop()
+            elapsed = time.perf_counter() - frame.start
+            if frames:
+                frames[-1].nested += elapsed
+            exclusive = elapsed - frame.nested
+            profile.stages[name] += exclusive
+            statement: Optional[_Statement] = self._local.statement
+            if statement is not None:
+                statement.stages[name] += exclusive
+
+    def iter_stage(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """
+        Yield from iterable, timing how long it takes to produce each item as stage name
+        """
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                item = next(iterator, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                return
+            yield item  # type: ignore
+
+    @contextmanager
+    def statement(self, position: int, sql: str) -> Iterator[None]:
+        """
+        Attribute the stages run until exit to the statement at position in the script
+        """
+        profile = self._profile
+        if profile is None:
+            yield
+            return
+        statement = self._local.statement = _Statement(position, sql)
+        try:
+            yield
+        finally:
+            self._local.statement = None
+            profile.statements.append(
+                StatementProfile(
+                    position=statement.position,
+                    sql=statement.sql,
+                    seconds=time.perf_counter() - statement.start,
+                    stages=dict(statement.stages),
+                    cached=statement.cached,
+                    nodes=statement.nodes,
+                    edges=statement.edges,
+                )
+            )
+
+    def record_statement(self, graph: DiGraph, cached: bool) -> None:
+        """
+        :param graph: the lineage graph of the statement being analyzed
+        :param cached: whether the lineage came from the lineage cache
+        """
+        profile = self._profile
+        if profile is None:
+            return
+        if cached:
+            profile.cache_hits += 1
+        else:
+            profile.cache_misses += 1
+        statement: Optional[_Statement] = self._local.statement
+        if statement is not None:
+            statement.cached = cached
+            statement.nodes = graph.number_of_nodes()
+            statement.edges = graph.number_of_edges()
+
+    def record_graph(self, graph: DiGraph) -> None:
+        """
+        :param graph: the combined lineage graph of the script
+        """
+        profile = self._profile
+        if profile is not None:
+            profile.nodes = graph.number_of_nodes()
+            profile.edges = graph.number_of_edges()
+
+
+profiler = Profiler()
@@ -1,16 +1,36 @@
 import logging
+import os
 import warnings
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from sqllineage import DEFAULT_DIALECT, SQLPARSE_DIALECT
-from sqllineage.core.holders import SQLLineageHolder
+from sqllineage.core.analyzer import LineageAnalyzer
+from sqllineage.core.cache import lineage_cache
+from sqllineage.core.holders import SQLLineageHolder, StatementLineageHolder
+from sqllineage.core.interning import intern_registry
 from sqllineage.core.models import Column, Table
 from sqllineage.core.parser.sqlfluff.analyzer import SqlFluffLineageAnalyzer
+from sqllineage.core.parser.sqlfluff.linter_pool import linter_pool
 from sqllineage.core.parser.sqlparse.analyzer import SqlParseLineageAnalyzer
+from sqllineage.core.profiler import LineageProfile, profiler
 from sqllineage.drawing import draw_lineage_graph
 from sqllineage.io import to_cytoscape
 from sqllineage.utils.constant import LineageLevel
 from sqllineage.utils.helpers import split, trim_comment
+from sqllineage.utils.splitter import iter_statements, strip_comments
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +49,83 @@ def lazy_property(func):
     return property(lazy_method(func))
 
 
+def warn_deprecated_dialect(dialect: str, stacklevel: int = 3) -> None:
+    if dialect == SQLPARSE_DIALECT:
+        warnings.warn(
+            "dialect `non-validating` is deprecated, use `ansi` or dialect of your SQL instead. "
+            "`non-validating` will stop being the default dialect in v1.5.x release "
+            "and be completely removed in v1.6.x",
+            DeprecationWarning,
+            stacklevel=stacklevel,
+        )
+
+
+def get_analyzer(dialect: str) -> LineageAnalyzer:
+    return (
+        SqlParseLineageAnalyzer()
+        if dialect == SQLPARSE_DIALECT
+        else SqlFluffLineageAnalyzer(dialect)
+    )
+
+
+def analyze_statement(
+    analyzer: LineageAnalyzer, stmt: str, dialect: str
+) -> StatementLineageHolder:
+    """
+    analyze a single statement, looking up the lineage cache first
+    """
+    with profiler.stage("cache"):
+        holder = lineage_cache.get(stmt, dialect)
+    cached = holder is not None
+    if holder is None:
+        holder = analyzer.analyze(stmt)
+        with profiler.stage("cache"):
+            lineage_cache.put(stmt, dialect, holder)
+    profiler.record_statement(holder.graph, cached)
+    return holder
+
+
+class LineageResult(NamedTuple):
+    """
+    Lineage result of one script analyzed by :meth:`LineageRunner.analyze_many`.
+    Exactly one of holder and error is set.
+    """
+
+    position: int
+    holder: Optional[SQLLineageHolder]
+    error: Optional[Exception]
+
+
+def _analyze_script(position: int, sql: str, dialect: str) -> LineageResult:
+    try:
+        analyzer = get_analyzer(dialect)
+        holders = [
+            analyze_statement(analyzer, stmt, dialect)
+            for stmt in split(sql.strip(), dialect)
+        ]
+        return LineageResult(position, SQLLineageHolder.of(*holders), None)
+    except Exception as e:  # noqa: B902
+        # one broken script shouldn't fail the whole batch, error is handed back to caller instead
+        return LineageResult(position, None, e)
+
+
+def _intern_result(result: LineageResult) -> LineageResult:
+    if result.holder is None:
+        return result
+    return result._replace(
+        holder=SQLLineageHolder(intern_registry.intern_graph(result.holder.graph))
+    )
+
+
+def _analyze_statement(stmt: str, dialect: str) -> StatementLineageHolder:
+    return analyze_statement(get_analyzer(dialect), stmt, dialect)
+
+
+def _init_worker(dialect: str) -> None:
+    if dialect != SQLPARSE_DIALECT:
+        linter_pool.warm_up(dialect)
+
+
 class LineageRunner(object):
     def __init__(
         self,
@@ -37,6 +134,9 @@ class LineageRunner(object):
         encoding: Optional[str] = None,
         verbose: bool = False,
         draw_options: Optional[Dict[str, str]] = None,
+        workers: int = 1,
+        intern: bool = False,
+        profile: bool = False,
     ):
         """
         The entry point of SQLLineage after command line options are parsed.
@@ -44,15 +144,13 @@ class LineageRunner(object):
         :param sql: a string representation of SQL statements.
         :param encoding: the encoding for sql string
         :param verbose: verbose flag indicate whether statement-wise lineage result will be shown
+        :param workers: number of processes to analyze statements in parallel, by default statements are analyzed
+            one by one in the current process
+        :param intern: replace tables and columns in lineage result with canonical instances shared across runs,
+            see :class:`sqllineage.core.interning.InternRegistry`
+        :param profile: record time spent per stage and per statement, see :attr:`profile`
         """
-        if dialect == SQLPARSE_DIALECT:
-            warnings.warn(
-                "dialect `non-validating` is deprecated, use `ansi` or dialect of your SQL instead. "
-                "`non-validating` will stop being the default dialect in v1.5.x release "
-                "and be completely removed in v1.6.x",
-                DeprecationWarning,
-                stacklevel=2,
-            )
+        warn_deprecated_dialect(dialect)
         self._encoding = encoding
         self._sql = sql
         self._verbose = verbose
@@ -60,16 +158,40 @@ class LineageRunner(object):
         self._evaluated = False
         self._stmt: List[str] = []
         self._dialect = dialect
+        self._workers = workers
+        self._intern = intern
+        self._path: Optional[str] = None
+        self._stmt_count = 0
+        self._profile = LineageProfile() if profile else None
+
+    @classmethod
+    def from_file(
+        cls, path: str, dialect: str = DEFAULT_DIALECT, **kwargs
+    ) -> "LineageRunner":
+        """
+        Build a runner reading SQL statements from a file.
+
+        Instead of loading the whole file, statements are read and analyzed one at a time, so a huge script is
+        processed in bounded memory. Statements are only kept around when verbose flag is set.
+
+        :param path: path to the SQL file
+        :param dialect: dialect used to analyze the statements
+        :param kwargs: other parameters as accepted by :class:`LineageRunner`, encoding applies to the file
+        """
+        runner = cls("", dialect=dialect, **kwargs)
+        runner._path = path
+        if runner._draw_options.get("f") is None:
+            runner._draw_options["f"] = path
+        return runner
 
     @lazy_method
     def __str__(self):
         """
         print out the Lineage Summary.
         """
-        statements = self.statements()
         source_tables = "\n    ".join(str(t) for t in self.source_tables)
         target_tables = "\n    ".join(str(t) for t in self.target_tables)
-        combined = f"""Statements(#): {len(statements)}
+        combined = f"""Statements(#): {self._stmt_count}
 Source Tables:
     {source_tables}
 Target Tables:
@@ -82,6 +204,7 @@ Target Tables:
             combined += f"""Intermediate Tables:
     {intermediate_tables}"""
         if self._verbose:
+            statements = self.statements()
             result = ""
             for i, holder in enumerate(self._stmt_holders):
                 stmt_short = statements[i].replace("\n", "")
@@ -115,50 +238,100 @@ Target Tables:
             draw_options["dialect"] = dialect
         return draw_lineage_graph(**draw_options)
 
+    @property
+    def profile(self) -> Optional[LineageProfile]:
+        """
+        timings of the analysis so far, broken down by stage and by statement, None unless created with profile=True.
+        With workers, statements are analyzed in other processes and only stages of the current process are recorded.
+        """
+        return self._profile
+
+    @contextmanager
+    def _profiled(self, stage: str) -> Iterator[None]:
+        with profiler.activate(self._profile), profiler.stage(stage):
+            yield
+
     @lazy_method
     def statements(self) -> List[str]:
         """
         a list of SQL statements.
         """
-        return [trim_comment(s) for s in self._stmt]
+        if self._path is None or self._verbose:
+            return [trim_comment(s) for s in self._stmt]
+        # comments are already found while reading file
+        return [
+            strip_comments(s.sql, s.comments)
+            for s in iter_statements(self._path, self._encoding, dialect=self._dialect)
+        ]
 
     @lazy_property
     def source_tables(self) -> List[Table]:
         """
         a list of source :class:`sqllineage.models.Table`
         """
-        return sorted(self._sql_holder.source_tables, key=lambda x: str(x))
+        with self._profiled("table_lineage"):
+            return sorted(self._sql_holder.source_tables, key=lambda x: str(x))
 
     @lazy_property
     def target_tables(self) -> List[Table]:
         """
         a list of target :class:`sqllineage.models.Table`
         """
-        return sorted(self._sql_holder.target_tables, key=lambda x: str(x))
+        with self._profiled("table_lineage"):
+            return sorted(self._sql_holder.target_tables, key=lambda x: str(x))
 
     @lazy_property
     def intermediate_tables(self) -> List[Table]:
         """
         a list of intermediate :class:`sqllineage.models.Table`
         """
-        return sorted(self._sql_holder.intermediate_tables, key=lambda x: str(x))
+        with self._profiled("table_lineage"):
+            return sorted(self._sql_holder.intermediate_tables, key=lambda x: str(x))
 
     @lazy_method
-    def get_column_lineage(self, exclude_subquery=True) -> List[Tuple[Column, Column]]:
+    def get_column_lineage(self, exclude_subquery=True) -> List[Tuple[Column, ...]]:
         """
         a list of column tuple :class:`sqllineage.models.Column`
         """
-        # sort by target column, and then source column
-        return sorted(
-            self._sql_holder.get_column_lineage(exclude_subquery),
-            key=lambda x: (str(x[-1]), str(x[0])),
-        )
+        with self._profiled("column_lineage"):
+            column_lineage = self._sql_holder.get_column_lineage(exclude_subquery)
+            # sort by target column, and then source column
+            return sorted(column_lineage, key=lambda x: (str(x[-1]), str(x[0])))
+
+    @lazy_method
+    def get_column_lineage_endpoints(
+        self, exclude_subquery=True
+    ) -> List[Tuple[Column, Column]]:
+        """
+        a list of (source column, target column) tuple :class:`sqllineage.models.Column`, without intermediate columns
+        """
+        with self._profiled("column_lineage"):
+            return sorted(
+                self._sql_holder.get_column_lineage_endpoints(exclude_subquery),
+                key=lambda x: (str(x[-1]), str(x[0])),
+            )
+
+    @lazy_method
+    def iter_column_lineage(
+        self, exclude_subquery=True
+    ) -> Iterator[Tuple[Column, ...]]:
+        """
+        yield column lineage path one by one, unsorted, without materializing all of them
+        """
+        yield from self._sql_holder.iter_column_lineage(exclude_subquery)
 
-    def print_column_lineage(self) -> None:
+    def print_column_lineage(self, endpoints_only: bool = False) -> None:
         """
         print column level lineage to stdout
+
+        :param endpoints_only: only print source and target column, skipping intermediate columns
         """
-        for path in self.get_column_lineage():
+        paths: Iterable[Tuple[Column, ...]] = (
+            self.get_column_lineage_endpoints()
+            if endpoints_only
+            else self.get_column_lineage()
+        )
+        for path in paths:
             print(" <- ".join(str(col) for col in reversed(path)))
 
     def print_table_lineage(self) -> None:
@@ -167,13 +340,149 @@ Target Tables:
         """
         print(str(self))
 
+    @staticmethod
+    def analyze_many(
+        sqls: Iterable[str],
+        dialect: str = DEFAULT_DIALECT,
+        workers: Optional[int] = None,
+        intern: bool = False,
+    ) -> Iterator[LineageResult]:
+        """
+        Analyze many independent SQL scripts, yielding a :class:`LineageResult` for each one as soon as it completes.
+
+        Results come back in completion order, use ``LineageResult.position`` to match them with the input.
+        A script that fails to analyze yields a result with error set instead of stopping the batch.
+
+        :param sqls: an iterable of SQL scripts, each one may contain multiple statements
+        :param dialect: dialect shared by all the scripts
+        :param workers: number of worker processes, default to cpu count. With 1 worker, scripts are analyzed in the
+            current process.
+        :param intern: replace tables and columns in each result with canonical instances, which saves memory when
+            many results are kept, see :class:`sqllineage.core.interning.InternRegistry`
+        """
+        warn_deprecated_dialect(dialect)
+        workers = workers or os.cpu_count() or 1
+        finish = _intern_result if intern else lambda result: result
+        if workers == 1:
+            for index, sql in enumerate(sqls):
+                yield finish(_analyze_script(index, sql, dialect))
+            return
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(dialect,)
+        ) as executor:
+            # keep a bounded number of scripts in flight so that a lazy iterable is consumed lazily
+            pending: Set["Future[LineageResult]"] = set()
+            for index, sql in enumerate(sqls):
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield finish(future.result())
+                pending.add(executor.submit(_analyze_script, index, sql, dialect))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield finish(future.result())
+
+    def _analyze_in_parallel(self, stmts: List[str]) -> List[StatementLineageHolder]:
+        """
+        Each statement is analyzed independently, so we can dispatch them to worker processes in chunks.
+        Executor.map keeps the statement order, which matters when holders are combined later on.
+        """
+        workers = min(self._workers, len(stmts))
+        chunksize = max(1, len(stmts) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self._dialect,)
+        ) as executor:
+            return list(
+                executor.map(
+                    _analyze_statement,
+                    stmts,
+                    [self._dialect] * len(stmts),
+                    chunksize=chunksize,
+                )
+            )
+
+    def _iter_analyze_in_parallel(
+        self, stmts: Iterable[str]
+    ) -> Iterator[StatementLineageHolder]:
+        """
+        Like _analyze_in_parallel, but for a lazy iterable of statements: only a bounded number of statements are
+        submitted ahead, and holders are yielded in statement order.
+        """
+        with ProcessPoolExecutor(
+            max_workers=self._workers,
+            initializer=_init_worker,
+            initargs=(self._dialect,),
+        ) as executor:
+            pending: Deque["Future[StatementLineageHolder]"] = deque()
+            for stmt in stmts:
+                if len(pending) >= self._workers * 4:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(_analyze_statement, stmt, self._dialect))
+            while pending:
+                yield pending.popleft().result()
+
+    def _intern_holder(self, holder: StatementLineageHolder) -> StatementLineageHolder:
+        if self._intern:
+            holder.graph = intern_registry.intern_graph(holder.graph)
+        return holder
+
+    def _iter_file_statements(self, path: str) -> Iterator[str]:
+        for stmt in profiler.iter_stage(
+            "split", iter_statements(path, self._encoding, dialect=self._dialect)
+        ):
+            if self._verbose:
+                self._stmt.append(stmt.sql)
+            yield stmt.sql
+
+    def _iter_file_holders(self, path: str) -> Iterator[StatementLineageHolder]:
+        stmts = self._iter_file_statements(path)
+        if self._workers > 1:
+            holders = self._iter_analyze_in_parallel(stmts)
+        else:
+            analyzer = get_analyzer(self._dialect)
+            holders = (
+                self._analyze_statement(analyzer, i, s) for i, s in enumerate(stmts)
+            )
+        for holder in holders:
+            self._stmt_count += 1
+            holder = self._intern_holder(holder)
+            if self._verbose:
+                self._stmt_holders.append(holder)
+            yield holder
+
+    def _analyze_statement(
+        self, analyzer: LineageAnalyzer, index: int, stmt: str
+    ) -> StatementLineageHolder:
+        with profiler.statement(index, stmt):
+            return analyze_statement(analyzer, stmt, self._dialect)
+
     def _eval(self):
-        self._stmt = split(self._sql.strip())
-        analyzer = (
-            SqlParseLineageAnalyzer()
-            if self._dialect == SQLPARSE_DIALECT
-            else SqlFluffLineageAnalyzer(self._dialect)
-        )
-        self._stmt_holders = [analyzer.analyze(stmt) for stmt in self._stmt]
-        self._sql_holder = SQLLineageHolder.of(*self._stmt_holders)
+        with profiler.activate(self._profile):
+            self._eval_holders()
+            profiler.record_graph(self._sql_holder.graph)
         self._evaluated = True
+
+    def _eval_holders(self) -> None:
+        if self._path is not None:
+            self._stmt_holders = []
+            with profiler.stage("build_graph"):
+                self._sql_holder = SQLLineageHolder.of_iterable(
+                    self._iter_file_holders(self._path)
+                )
+            return
+        with profiler.stage("split"):
+            self._stmt = split(self._sql.strip(), self._dialect)
+        self._stmt_count = len(self._stmt)
+        if self._workers > 1 and len(self._stmt) > 1:
+            with profiler.stage("parallel_analysis"):
+                self._stmt_holders = self._analyze_in_parallel(self._stmt)
+        else:
+            analyzer = get_analyzer(self._dialect)
+            self._stmt_holders = [
+                self._analyze_statement(analyzer, i, stmt)
+                for i, stmt in enumerate(self._stmt)
+            ]
+        self._stmt_holders = [self._intern_holder(h) for h in self._stmt_holders]
+        with profiler.stage("build_graph"):
+            self._sql_holder = SQLLineageHolder.of(*self._stmt_holders)
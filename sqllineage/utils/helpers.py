@@ -1,6 +1,9 @@
 import logging
 from argparse import Namespace
-from typing import List
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from sqllineage.utils.splitter import GO_DIALECTS, StatementSplitter, strip_comments
 
 logger = logging.getLogger(__name__)
 
@@ -9,37 +12,51 @@ def escape_identifier_name(name: str):
     return name.strip("`").strip('"').strip("'").strip("[").strip("]")
 
 
+@contextmanager
+def _exit_on_file_error(path: str) -> Iterator[None]:
+    try:
+        yield
+    except IsADirectoryError:
+        logger.exception("%s is a directory", path)
+        exit(1)
+    except FileNotFoundError:
+        logger.exception("No such file: %s", path)
+        exit(1)
+    except PermissionError:
+        # On Windows, open a directory as file throws PermissionError
+        logger.exception("Permission denied when reading file '%s'", path)
+        exit(1)
+
+
+def check_sql_file(path: str) -> None:
+    """
+    exit with the same error as extract_sql_from_args when the SQL file can't be read, without reading it
+    """
+    with _exit_on_file_error(path), open(path, "rb"):
+        pass
+
+
 def extract_sql_from_args(args: Namespace) -> str:
     sql = ""
     if getattr(args, "f", None):
-        try:
-            with open(args.f) as f:
-                sql = f.read()
-        except IsADirectoryError:
-            logger.exception("%s is a directory", args.f)
-            exit(1)
-        except FileNotFoundError:
-            logger.exception("No such file: %s", args.f)
-            exit(1)
-        except PermissionError:
-            # On Windows, open a directory as file throws PermissionError
-            logger.exception("Permission denied when reading file '%s'", args.f)
-            exit(1)
+        with _exit_on_file_error(args.f), open(args.f) as f:
+            sql = f.read()
     elif getattr(args, "e", None):
         sql = args.e
     return sql
 
 
-def split(sql: str) -> List[str]:
-    # TODO: we need a parser independent split function
-    import sqlparse
+def split(sql: str, dialect: Optional[str] = None) -> List[str]:
+    """
+    Split a SQL script into statements, whitespace around each of them kept as is.
+    Statements made of whitespace and comments only are excluded.
 
-    # sometimes sqlparse split out a statement that is comment only, we want to exclude that
-    return [s.value for s in sqlparse.parse(sql) if s.token_first(skip_cm=True)]
+    :param sql: SQL script
+    :param dialect: dialect of the script, GO on a line of its own separates batches for dialects in GO_DIALECTS
+    """
+    splitter = StatementSplitter(strip=False, split_on_go=dialect in GO_DIALECTS)
+    return [s.sql for s in splitter.feed(sql) + splitter.close()]
 
 
 def trim_comment(sql: str) -> str:
-    # TODO: we need a parser independent trim_comment function
-    import sqlparse
-
-    return str(sqlparse.format(sql, strip_comments=True))
+    return strip_comments(sql)
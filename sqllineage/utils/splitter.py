@@ -0,0 +1,474 @@
+"""
+SQL statement splitter, independent of any parser.
+
+Statement boundaries are told apart with a handful of lexical rules instead of a full tokenization: a semicolon ends a
+statement unless it's inside a quoted string, a quoted identifier, a comment or a dollar-quoted body, or nested in
+parenthesis or a procedural block. Block nesting follows the same rules as sqlparse, so that scripts are split the way
+they always have been: inside CREATE statements, BEGIN, DECLARE and IF/FOR/WHILE/CASE within BEGIN open a block, which
+END closes. Whitespace and single line comments after the semicolon on the same line stay with the statement.
+T-SQL batch separator GO, on a line of its own, can optionally end a statement as well.
+
+sqlparse also needs the whole script in memory and tokenizes all of it before the first statement comes out. For a
+huge script, StatementSplitter is fed text chunk by chunk instead, and gives back each statement as soon as it ends,
+so that only the statement being read is held in memory.
+
+The same lexical rules find comments, so that they can be stripped from statements without a full tokenization either.
+"""
+
+import codecs
+import locale
+import re
+from typing import Iterator, List, Match, NamedTuple, Optional, Sequence, Tuple
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# dialects where GO on a line of its own separates batches
+GO_DIALECTS = ("tsql",)
+
+_NORMAL = "normal"
+_SINGLE_QUOTE = "'"
+_DOUBLE_QUOTE = '"'
+_BACKTICK = "`"
+_LINE_COMMENT = "--"
+_BLOCK_COMMENT = "/*"
+_DOLLAR_QUOTE = "$"
+
+# tokens that might change lexical state, nesting level or end a statement. Keywords preceded by @, #, $ or \ are
+# variables, placeholders or commands
+_TOKEN = re.compile(
+    r"""
+    (?P<quote>['"`])
+    |(?P<comment>--|(?<![\w$\#])\#[ ]|/\*)
+    |(?P<dollar>(?<!\S)\$(?:[_A-ZÀ-Ü]\w*)?\$)
+    |(?P<punct>[;()\[])
+    |(?<![\w$\#@\\])(?P<keyword>BEGIN|CASE|CREATE|DECLARE|END|FOR|GO|HANDLER|IF|WHILE)(?![\w$\#])
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+# a keyword followed by these is a function or a qualifier
+_NAME_SUFFIX = re.compile(r"\(|\s*\.")
+_END_SUFFIX = re.compile(r"\s+(?:IF|LOOP|WHILE)\b", re.IGNORECASE)
+_HANDLER_SUFFIX = re.compile(r"\s+FOR\b", re.IGNORECASE)
+_GO_SUFFIX = re.compile(r"(?:[^\S\r\n]+\d+)?[^\S\r\n]*(?:\r\n|\r|\n|\Z)")
+# a colon preceded by these is not the start of a placeholder
+_COLON_PREFIX = re.compile(r"[\w:]")
+_BRACKET_NAME = re.compile(r"\[[^\]\[]+\]")
+_PARTIAL_BRACKET_NAME = re.compile(r"\[[^\]\[]*\Z")
+# whitespace and single line comments following a semicolon
+_TRAILER = re.compile(r"(?:[^\S\r\n]+|(?:--|\#[ ])(?!\+)[^\r\n]*(?:\r\n|\r|\n|\Z))*")
+_LINE_COMMENT_PATTERN = re.compile(r"(?:--|\#[ ])[^\r\n]*(?:\r\n|\r|\n)?")
+# a keyword this close to the end of text might be followed by more of itself, or by a suffix, in the next chunk
+_PARTIAL_SUFFIX = re.compile(r"\s*\S{0,15}\Z")
+# length of unmatched text kept for next chunk, enough to hold a partial token
+_TAIL = 64
+
+
+class SplitStatement(NamedTuple):
+    sql: str
+    # byte offset of the statement in the encoded script
+    offset: int
+    # start and end position of each comment in sql
+    comments: Tuple[Tuple[int, int], ...] = ()
+
+
+class StatementSplitter:
+    """
+    Split SQL statements out of text fed chunk by chunk.
+
+    Statements keep their terminating semicolon. Statements made of whitespace and comments only are skipped.
+    Comments found along the way are recorded with each statement, for :func:`strip_comments` to remove them without
+    looking for them again.
+    """
+
+    def __init__(
+        self, encoding: str = "utf-8", strip: bool = True, split_on_go: bool = False
+    ):
+        """
+        :param encoding: encoding used to compute byte offsets of statements
+        :param strip: strip statements of surrounding whitespace
+        :param split_on_go: end a statement with GO on a line of its own, the line itself being dropped
+        """
+        self._encoding = encoding
+        self._strip = strip
+        self._split_on_go = split_on_go
+        self._buffer = ""
+        # start of current statement and position where scanning resumes in buffer, and byte offset of current
+        # statement in the script
+        self._start = 0
+        self._pos = 0
+        self._offset = 0
+        self._state = _NORMAL
+        self._dollar_tag = ""
+        # start of the comment being read, relative to the start of current statement
+        self._comment_start = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._has_code = False
+        self._comments: List[Tuple[int, int]] = []
+        self._level = 0
+        self._begin_depth = 0
+        self._is_create = False
+
+    def feed(self, text: str) -> List[SplitStatement]:
+        """
+        :param text: next chunk of the script
+        :return: statements completed within this chunk
+        """
+        self._buffer += text
+        return self._scan(final=False)
+
+    def close(self) -> List[SplitStatement]:
+        """
+        :return: the last statement, when the script doesn't end with a semicolon
+        """
+        statements = self._scan(final=True)
+        if self._state == _LINE_COMMENT:
+            self._end_comment(len(self._buffer))
+        self._emit(len(self._buffer), statements)
+        self._buffer = ""
+        self._start = 0
+        return statements
+
+    def _emit(self, end: int, statements: List[SplitStatement]) -> None:
+        start = self._start
+        raw = self._buffer[start:end]
+        if self._has_code:
+            comments = self._comments
+            if self._strip:
+                sql = raw.strip()
+                leading = raw[: len(raw) - len(raw.lstrip())]
+                offset = self._offset + len(leading.encode(self._encoding))
+                shift = len(leading)
+                comments = [(s - shift, min(e - shift, len(sql))) for s, e in comments]
+            else:
+                sql, offset = raw, self._offset
+            statements.append(SplitStatement(sql, offset, tuple(comments)))
+        self._skip(end)
+
+    def _end_comment(self, end: int) -> None:
+        self._comments.append((self._comment_start, end - self._start))
+
+    def _skip(self, end: int) -> None:
+        start = self._start
+        self._offset += len(self._buffer[start:end].encode(self._encoding))
+        self._start = end
+        self._reset()
+
+    def _keyword(
+        self, start: int, end: int, keyword: str, statements: List[SplitStatement]
+    ) -> int:
+        """
+        Update nesting level with a keyword.
+
+        :return: position where scanning resumes
+        """
+        buf = self._buffer
+        if keyword != "GO":
+            # GO might be a batch separator, any other keyword is code even when scanning resumes past its suffix
+            self._has_code = True
+        if keyword != "CASE" and _NAME_SUFFIX.match(buf, end):
+            return end
+        if (
+            start > 0
+            and buf[start - 1] == ":"
+            and (start < 2 or not _COLON_PREFIX.match(buf, start - 2))
+        ):
+            # a placeholder like :name
+            return end
+        if keyword == "END":
+            suffix = _END_SUFFIX.match(buf, end)
+            if suffix is not None:
+                if suffix.group().upper() in (" IF", " WHILE"):
+                    self._level -= 1
+                return suffix.end()
+            self._begin_depth = max(0, self._begin_depth - 1)
+            self._level -= 1
+        elif keyword == "CREATE":
+            self._is_create = True
+        elif keyword == "BEGIN":
+            self._begin_depth += 1
+            if self._is_create:
+                self._level += 1
+        elif keyword == "DECLARE":
+            if self._is_create and self._begin_depth == 0:
+                self._level += 1
+        elif keyword == "HANDLER":
+            suffix = _HANDLER_SUFFIX.match(buf, end)
+            if suffix is not None:
+                return suffix.end()
+        elif keyword == "GO":
+            suffix = _GO_SUFFIX.match(buf, end)
+            line_start = max(buf.rfind("\n", 0, start), buf.rfind("\r", 0, start)) + 1
+            # a line starting before current statement holds the end of previous one, GO isn't on its own there
+            if (
+                self._split_on_go
+                and suffix is not None
+                and line_start >= self._start
+                and not buf[line_start:start].strip()
+            ):
+                self._emit(line_start, statements)
+                self._skip(suffix.end())
+                return suffix.end()
+        elif self._is_create and self._begin_depth > 0:
+            # IF, FOR, WHILE or CASE
+            self._level += 1
+        self._has_code = True
+        return end
+
+    def _scan(self, final: bool) -> List[SplitStatement]:
+        statements: List[SplitStatement] = []
+        buf = self._buffer
+        i = self._pos
+        n = len(buf)
+        while i < n:
+            state = self._state
+            if state == _NORMAL:
+                match = _TOKEN.search(buf, i)
+                if match is None:
+                    # keep the tail in sight in case it's the start of a token completed in next chunk
+                    end = n if final else max(i, n - _TAIL)
+                else:
+                    end = match.start()
+                if not self._has_code and buf[i:end].strip():
+                    self._has_code = True
+                if match is None:
+                    i = end
+                    break
+                i = end
+                kind = match.lastgroup
+                if kind == "punct":
+                    char = buf[i]
+                    if char == ";":
+                        if self._level > 0:
+                            self._has_code = True
+                            i += 1
+                            continue
+                        trailer = _TRAILER.match(buf, i + 1)
+                        trailer_end = trailer.end() if trailer else i + 1
+                        if n - trailer_end < 3 and not final:
+                            # a comment or a hint might start at the end of text
+                            break
+                        self._has_code = True
+                        start = self._start
+                        for comment in _LINE_COMMENT_PATTERN.finditer(
+                            buf, i + 1, trailer_end
+                        ):
+                            self._comments.append(
+                                (comment.start() - start, comment.end() - start)
+                            )
+                        i = trailer_end
+                        self._emit(i, statements)
+                        continue
+                    self._has_code = True
+                    if char == "(":
+                        self._level += 1
+                    elif char == ")":
+                        self._level -= 1
+                    elif (
+                        i == 0
+                        or buf[i - 1] not in "])"
+                        and not buf[i - 1].isalnum()
+                        and buf[i - 1] != "_"
+                    ):
+                        # square bracket quoted identifier, otherwise an array index
+                        name = _BRACKET_NAME.match(buf, i)
+                        if name is not None:
+                            i = name.end()
+                            continue
+                        if not final and _PARTIAL_BRACKET_NAME.match(buf, i):
+                            break
+                    i += 1
+                elif kind == "keyword":
+                    if not final and _PARTIAL_SUFFIX.match(buf, match.end()):
+                        break
+                    i = self._keyword(i, match.end(), match.group().upper(), statements)
+                elif kind == "quote":
+                    self._state = buf[i]
+                    self._has_code = True
+                    i += 1
+                elif kind == "dollar":
+                    self._state = _DOLLAR_QUOTE
+                    self._dollar_tag = match.group()
+                    self._has_code = True
+                    i = match.end()
+                else:
+                    self._state = _BLOCK_COMMENT if buf[i] == "/" else _LINE_COMMENT
+                    self._comment_start = i - self._start
+                    i = match.end()
+            elif state == _LINE_COMMENT:
+                end = buf.find("\n", i)
+                if end == -1:
+                    i = n
+                else:
+                    self._state = _NORMAL
+                    i = end + 1
+                    self._end_comment(i)
+            elif state == _BLOCK_COMMENT:
+                end = buf.find("*/", i)
+                if end == -1:
+                    # keep the trailing "*" in sight in case "/" comes in next chunk
+                    i = max(i, n - 1)
+                    break
+                self._state = _NORMAL
+                i = end + 2
+                self._end_comment(i)
+            elif state == _DOLLAR_QUOTE:
+                end = buf.find(self._dollar_tag, i)
+                if end == -1:
+                    i = max(i, n - len(self._dollar_tag) + 1)
+                    break
+                self._state = _NORMAL
+                i = end + len(self._dollar_tag)
+            else:
+                # quoted string or identifier: a doubled quote is an escaped quote, and so is a backslash escaped
+                # one inside a string literal
+                end = buf.find(state, i)
+                backslash = buf.find("\\", i) if state != _BACKTICK else -1
+                if backslash != -1 and (end == -1 or backslash < end):
+                    if backslash + 1 >= n and not final:
+                        i = backslash
+                        break
+                    i = backslash + 2
+                    continue
+                if end == -1:
+                    i = n
+                    break
+                if end + 1 >= n and not final:
+                    i = end
+                    break
+                if end + 1 < n and buf[end + 1] == state:
+                    i = end + 2
+                else:
+                    self._state = _NORMAL
+                    i = end + 1
+        # drop emitted statements from buffer once per chunk rather than once per statement. The last character before
+        # current statement is kept, so that lookbehinds see the same text as they would in the whole script
+        context = 1 if self._start > 0 else 0
+        start = self._start - context
+        self._buffer = buf[start:]
+        self._pos = min(i, n) - start
+        self._start = context
+        return statements
+
+
+# comments, along with the quoted text or dollar-quoted bodies they might appear in
+_COMMENT = re.compile(
+    r"""
+    '(?:''|\\.|[^'\\])*'
+    |"(?:""|\\.|[^"\\])*"
+    |`(?:``|[^`])*`
+    |(?<!\S)(?P<tag>\$(?:[_A-ZÀ-Ü]\w*)?\$)[\s\S]*?(?P=tag)
+    |(?P<comment>(?:--|(?<![\w$\#])\#[ ])[^\r\n]*(?:\r\n|\r|\n)?|/\*[\s\S]*?\*/)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+_SPACE = re.compile(r"\s*")
+_TRAILING_NEWLINE = re.compile(r"([\r\n]+) *\Z")
+# trailing whitespace of each line, outside quoted strings
+_LINE_END = re.compile(
+    r"""'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|(?P<space>[^\S\r\n]*(?:\r\n|\r|\n|\Z))"""
+)
+
+
+def find_comments(sql: str) -> List[Tuple[int, int]]:
+    """
+    :param sql: a SQL statement
+    :return: start and end position of each comment in sql
+    """
+    return [m.span("comment") for m in _COMMENT.finditer(sql) if m.group("comment")]
+
+
+def _space_end(sql: str, pos: int) -> int:
+    space = _SPACE.match(sql, pos)
+    return space.end() if space else pos
+
+
+def _replacement(comment: str) -> str:
+    newline = _TRAILING_NEWLINE.search(comment)
+    return newline.group(1) if newline else " "
+
+
+def _rstrip_line(match: Match[str]) -> str:
+    space = match.group("space")
+    if space is None:
+        return str(match.group())
+    return "\n" if space.rstrip(" \t\f\v") else ""
+
+
+def strip_comments(
+    sql: str, comments: Optional[Sequence[Tuple[int, int]]] = None
+) -> str:
+    """
+    Remove comments from a SQL statement, in the same way as sqlparse.format(sql, strip_comments=True) does.
+
+    A comment, together with the comments and whitespace following it, is replaced with a line break when it ends
+    with one, or a space otherwise. Nothing is left for a comment at the very beginning of statement or right after an
+    opening parenthesis. Trailing whitespace of each line is removed as well.
+
+    :param sql: a SQL statement
+    :param comments: start and end position of each comment in sql, found with :func:`find_comments` when not given
+    """
+    if comments is None:
+        comments = find_comments(sql)
+    parts = []
+    pos = 0
+    count = len(comments)
+    k = 0
+    while k < count:
+        start, end = comments[k]
+        # comments separated by whitespace only are replaced as a whole
+        last = k
+        space_end = _space_end(sql, end)
+        while last + 1 < count and comments[last + 1][0] == space_end:
+            last += 1
+            space_end = _space_end(sql, comments[last][1])
+        parts.append(sql[pos:start])
+        keep_first = start > 0 and sql[start - 1] != "("
+        if space_end < len(sql):
+            if keep_first:
+                parts.append(_replacement(sql[start:space_end]))
+            pos = space_end
+        else:
+            # comments at the end of statement are replaced one by one
+            keep = keep_first
+            for j in range(k, last + 1):
+                comment_start, comment_end = comments[j]
+                if j > k:
+                    previous_end = comments[j - 1][1]
+                    space = sql[previous_end:comment_start]
+                    parts.append(space)
+                    keep = keep or bool(space)
+                if keep:
+                    parts.append(_replacement(sql[comment_start:comment_end]))
+            pos = comments[last][1]
+        k = last + 1
+    parts.append(sql[pos:])
+    return _LINE_END.sub(_rstrip_line, "".join(parts))
+
+
+def iter_statements(
+    path: str,
+    encoding: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dialect: Optional[str] = None,
+) -> Iterator[SplitStatement]:
+    """
+    Read a SQL script file chunk by chunk and yield its statements one by one.
+
+    :param path: path to SQL script file
+    :param encoding: encoding of the file, default to the same as open() would use
+    :param chunk_size: number of bytes read at a time
+    :param dialect: dialect of the script, GO separates batches for dialects in GO_DIALECTS
+    """
+    encoding = encoding or locale.getpreferredencoding(False)
+    decoder = codecs.getincrementaldecoder(encoding)()
+    splitter = StatementSplitter(encoding, split_on_go=dialect in GO_DIALECTS)
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield from splitter.feed(decoder.decode(chunk))
+    yield from splitter.feed(decoder.decode(b"", final=True))
+    yield from splitter.close()
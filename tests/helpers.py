@@ -1,6 +1,7 @@
 import networkx as nx
 
 from sqllineage import SQLPARSE_DIALECT
+from sqllineage.core.graph import to_networkx
 from sqllineage.core.models import Column, Table
 from sqllineage.runner import LineageRunner
 
@@ -75,7 +76,9 @@ def assert_column_lineage_equal(
 
 
 def assert_lr_graphs_match(lr: LineageRunner, lr_sqlfluff: LineageRunner) -> None:
-    assert nx.is_isomorphic(lr._sql_holder.graph, lr_sqlfluff._sql_holder.graph), (
+    assert nx.is_isomorphic(
+        to_networkx(lr._sql_holder.graph), to_networkx(lr_sqlfluff._sql_holder.graph)
+    ), (
         f"\n\tGraph with sqlparse: {lr._sql_holder.graph}\n\t"
         f"Graph with sqlfluff: {lr_sqlfluff._sql_holder.graph}"
     )
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from benchmarks.cli import main
+from benchmarks.generators import SCENARIOS
+from benchmarks.harness import percentile
+from sqllineage.runner import LineageRunner
+
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+@pytest.mark.parametrize("dialect", ["non-validating", "ansi"])
+def test_scenario_analyzable(scenario: str, dialect: str):
+    sql = SCENARIOS[scenario].generator(3)
+    runner = LineageRunner(sql, dialect=dialect)
+    assert runner.source_tables or runner.target_tables
+    runner.get_column_lineage()
+
+
+def test_percentile():
+    samples = [float(i) for i in range(100, 0, -1)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile(samples, 100) == 100.0
+    assert percentile([1.0], 99) == 1.0
+
+
+def test_main_writes_results(tmp_path):
+    output = str(tmp_path / "results.json")
+    args = ["-s", "deep_cte", "-d", "non-validating", "--scale", "0.1", "-n", "2"]
+    main(args + ["-o", output])
+    with open(output) as f:
+        report = json.load(f)
+    assert [(r["scenario"], r["level"]) for r in report["results"]] == [
+        ("deep_cte", "table"),
+        ("deep_cte", "column"),
+    ]
+    assert all(r["p50_ms"] <= r["p99_ms"] for r in report["results"])
+    assert all(0 < r["extract_p50_ms"] <= r["p50_ms"] for r in report["results"])
+    main(args + ["-o", output, "-b", output])
@@ -0,0 +1,111 @@
+import pytest
+
+from sqllineage.core.cache import DiskLineageCache, LineageCache
+from sqllineage.core.holders import StatementLineageHolder
+from sqllineage.core.models import Schema, Table
+from sqllineage.runner import LineageRunner
+
+
+@pytest.fixture
+def runner_cache(monkeypatch):
+    # default cache size comes from SQLLINEAGE_CACHE_SIZE, pin one so that tests don't depend on environment
+    cache = LineageCache(max_size=8)
+    monkeypatch.setattr("sqllineage.runner.lineage_cache", cache)
+    return cache
+
+
+def _holder(table: str) -> StatementLineageHolder:
+    holder = StatementLineageHolder()
+    holder.add_read(Table(table))
+    return holder
+
+
+def test_cache_hit_and_miss():
+    cache = LineageCache(max_size=2)
+    assert cache.get("select * from tab1", "ansi") is None
+    cache.put("select * from tab1", "ansi", _holder("tab1"))
+    assert cache.get("  select * from tab1\n", "ansi").read == {Table("tab1")}
+    assert cache.get("select * from tab1", "mysql") is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 1)
+
+
+def test_cache_returns_copy():
+    cache = LineageCache(max_size=2)
+    cache.put("select * from tab1", "ansi", _holder("tab1"))
+    cache.get("select * from tab1", "ansi").add_read(Table("tab2"))
+    assert cache.get("select * from tab1", "ansi").read == {Table("tab1")}
+
+
+def test_cache_copies_nodes():
+    cache = LineageCache(max_size=2)
+    holder = _holder("tab1")
+    cache.put("select * from tab1", "ansi", holder)
+    next(iter(holder.read)).schema = Schema("schema1")
+    cached = cache.get("select * from tab1", "ansi")
+    next(iter(cached.read)).raw_name = "tab2"
+    assert [str(t) for t in cache.get("select * from tab1", "ansi").read] == [
+        "<default>.tab1"
+    ]
+
+
+def test_cache_lru_eviction():
+    cache = LineageCache(max_size=2)
+    for i in range(3):
+        cache.put(f"select * from tab{i}", "ansi", _holder(f"tab{i}"))
+        cache.get("select * from tab0", "ansi")
+    assert cache.get("select * from tab0", "ansi") is not None
+    assert cache.get("select * from tab1", "ansi") is None
+    assert cache.get("select * from tab2", "ansi") is not None
+    assert cache.stats().evictions == 1
+    cache.clear()
+    assert cache.stats() == (0, 0, 0, 0, 2)
+
+
+def test_cache_disabled():
+    cache = LineageCache(max_size=0)
+    cache.put("select * from tab1", "ansi", _holder("tab1"))
+    assert cache.get("select * from tab1", "ansi") is None
+    assert cache.stats().size == 0
+
+
+def test_runner_with_cache(runner_cache):
+    sql = "insert into tab2 select col1 from tab1"
+    for _ in range(2):
+        runner = LineageRunner(sql, dialect="ansi")
+        assert [str(t) for t in runner.source_tables] == ["<default>.tab1"]
+        assert [str(t) for t in runner.target_tables] == ["<default>.tab2"]
+    assert runner_cache.stats().hits == 1
+
+
+def test_disk_cache(tmp_path):
+    disk_cache = DiskLineageCache(str(tmp_path))
+    key = LineageCache.key("select * from tab1", "ansi")
+    assert disk_cache.get(key) is None
+    disk_cache.put(key, _holder("tab1"))
+    assert disk_cache.get(key).read == {Table("tab1")}
+    assert (disk_cache.hits, disk_cache.misses) == (1, 1)
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_disk_cache_behind_memory_cache(tmp_path):
+    writer = LineageCache(max_size=2, persistent=DiskLineageCache(str(tmp_path)))
+    writer.put("select * from tab1", "ansi", _holder("tab1"))
+    # a fresh process starts with empty memory but shares the same directory
+    reader = LineageCache(max_size=2, persistent=DiskLineageCache(str(tmp_path)))
+    assert reader.get("select * from tab1", "ansi").read == {Table("tab1")}
+    assert reader.get("select * from tab1", "ansi").read == {Table("tab1")}
+    assert reader.stats().hits == 1 and reader.persistent.hits == 1
+
+
+def test_disk_cache_prune(tmp_path):
+    disk_cache = DiskLineageCache(str(tmp_path))
+    for i in range(3):
+        disk_cache.put(LineageCache.key(f"select * from tab{i}", "ansi"), _holder("t"))
+    stale = tmp_path.joinpath("0.0.0", "ansi", "00", "00.pickle")
+    stale.parent.mkdir(parents=True)
+    stale.write_bytes(b"")
+    assert disk_cache.prune() == 1
+    assert not stale.exists()
+    assert disk_cache.prune(max_bytes=0) == 3
+    assert not list(tmp_path.rglob("*.pickle"))
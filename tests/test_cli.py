@@ -6,6 +6,7 @@ import pytest
 
 from sqllineage import DATA_FOLDER
 from sqllineage.cli import main
+from sqllineage.core.cache import lineage_cache
 
 
 @patch("socketserver.BaseServer.serve_forever")
@@ -13,6 +14,15 @@ def test_cli_dummy(_):
     main([])
     main(["-e", "select * from dual"])
     main(["-e", "insert into foo select * from dual", "-l", "column"])
+    main(
+        [
+            "-e",
+            "insert into foo select * from dual",
+            "-l",
+            "column",
+            "--endpoints-only",
+        ]
+    )
     for dirname, _, files in os.walk(DATA_FOLDER):
         if len(files) > 0:
             sql_file = str(Path(dirname).joinpath(Path(files[0])))
@@ -43,3 +53,17 @@ def test_file_permission_error(_):
     with pytest.raises(SystemExit) as e:
         main(["-f", __file__])
     assert e.value.code == 1
+
+
+def test_cli_cache_dir(tmp_path, capsys):
+    cache_dir = str(tmp_path)
+    persistent = lineage_cache.persistent
+    main(["-e", "insert into cached select * from bar", "--cache-dir", cache_dir])
+    assert list(tmp_path.rglob("*.pickle"))
+    # the disk cache of one invocation doesn't leak into later runners in the same process
+    assert lineage_cache.persistent is persistent
+    main(["--cache-dir", cache_dir, "--cache-max-bytes", "0", "--prune-cache"])
+    assert "Pruned 1 entries" in capsys.readouterr().out
+    assert not list(tmp_path.rglob("*.pickle"))
+    with pytest.raises(SystemExit):
+        main(["--prune-cache"])
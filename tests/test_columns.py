@@ -52,6 +52,26 @@ FROM tab2 a
     )
 
 
+def test_select_column_qualified_wildcard():
+    sql = """INSERT INTO tab1
+SELECT a.col1, b.*
+FROM tab2 a
+         INNER JOIN tab3 b
+                    ON a.id = b.id"""
+    # sqlparse names the target column * instead of b.*
+    assert_column_lineage_equal(
+        sql,
+        [
+            (
+                ColumnQualifierTuple("col1", "tab2"),
+                ColumnQualifierTuple("col1", "tab1"),
+            ),
+            (ColumnQualifierTuple("*", "tab3"), ColumnQualifierTuple("b.*", "tab1")),
+        ],
+        test_sqlparse=False,
+    )
+
+
 def test_select_distinct_column():
     sql = """INSERT INTO tab1
 SELECT DISTINCT col1
@@ -219,6 +239,27 @@ FROM tab2"""
             ),
         ],
     )
+    sql = """INSERT INTO tab1
+SELECT col1 * 2 AS col3,
+       col1 * col2 AS col4
+FROM tab2"""
+    assert_column_lineage_equal(
+        sql,
+        [
+            (
+                ColumnQualifierTuple("col1", "tab2"),
+                ColumnQualifierTuple("col3", "tab1"),
+            ),
+            (
+                ColumnQualifierTuple("col1", "tab2"),
+                ColumnQualifierTuple("col4", "tab1"),
+            ),
+            (
+                ColumnQualifierTuple("col2", "tab2"),
+                ColumnQualifierTuple("col4", "tab1"),
+            ),
+        ],
+    )
 
 
 def test_select_column_using_expression_in_parenthesis():
@@ -370,6 +411,38 @@ FROM tab4"""
     )
 
 
+def test_select_column_using_scalar_subquery():
+    sql = """INSERT INTO tab1
+SELECT (SELECT max(b.col1) FROM tab2 b WHERE b.id = a.id) AS col1,
+       (SELECT col2 FROM (SELECT col2 FROM tab3) dt) AS col2,
+       (SELECT col3 FROM (SELECT 1 AS col3) dt) AS col3,
+       (SELECT col4 * 2 FROM tab5) AS col4,
+       (SELECT c.* FROM tab6 c) AS col5
+FROM tab4 a"""
+    assert_column_lineage_equal(
+        sql,
+        [
+            (
+                ColumnQualifierTuple("col1", "tab2"),
+                ColumnQualifierTuple("col1", "tab1"),
+            ),
+            (
+                ColumnQualifierTuple("col2", "tab3"),
+                ColumnQualifierTuple("col2", "tab1"),
+            ),
+            (
+                ColumnQualifierTuple("col4", "tab5"),
+                ColumnQualifierTuple("col4", "tab1"),
+            ),
+            (
+                ColumnQualifierTuple("*", "tab6"),
+                ColumnQualifierTuple("col5", "tab1"),
+            ),
+        ],
+        test_sqlparse=False,
+    )
+
+
 def test_select_column_with_table_qualifier():
     sql = """INSERT INTO tab1
 SELECT tab2.col1
@@ -1,5 +1,166 @@
-from sqllineage.core.holders import StatementLineageHolder
+import itertools
+import pickle
+import random
+
+import networkx as nx
+
+from sqllineage.core.holders import (
+    SQLLineageHolder,
+    StatementLineageHolder,
+    SubQueryLineageHolder,
+    merge_graph,
+    rename_node,
+)
+from sqllineage.core.models import Column, SubQuery, Table
+from sqllineage.utils.constant import EdgeType
 
 
 def test_dummy():
     assert str(StatementLineageHolder()) == repr(StatementLineageHolder())
+
+
+def _column(name: str, parent) -> Column:
+    col = Column(name)
+    col.parent = parent
+    return col
+
+
+def _all_simple_paths_lineage(holder, exclude_subquery=True):
+    column_graph = holder.graph.subgraph(
+        n for n in holder.graph.nodes if isinstance(n, Column)
+    )
+    sources = {n for n, deg in column_graph.in_degree if deg == 0}
+    targets = {n for n, deg in column_graph.out_degree if deg == 0}
+    if exclude_subquery:
+        targets = {n for n in targets if isinstance(n.parent, Table)}
+    # single column paths are left out, as all_simple_paths returned them only since networkx 3.3
+    return {
+        tuple(path)
+        for source, target in itertools.product(sources, targets)
+        for path in nx.all_simple_paths(holder.graph, source, target)
+        if len(path) > 1
+    }
+
+
+def _random_holder(seed: int, allow_cycle: bool) -> SQLLineageHolder:
+    rand = random.Random(seed)
+    parents = [Table("tab1"), Table("tab2"), SubQuery(None, "sq", "sq")]
+    columns = [_column(f"col{i}", rand.choice(parents)) for i in range(12)]
+    graph = nx.DiGraph()
+    for col in columns:
+        graph.add_edge(col.parent, col, type=EdgeType.HAS_COLUMN)
+    for _ in range(20):
+        src, tgt = rand.sample(range(len(columns)), 2)
+        if allow_cycle or src < tgt:
+            graph.add_edge(columns[src], columns[tgt], type=EdgeType.LINEAGE)
+    return SQLLineageHolder(graph)
+
+
+def test_column_lineage_same_as_all_simple_paths():
+    for seed in range(20):
+        for allow_cycle in (False, True):
+            holder = _random_holder(seed, allow_cycle)
+            for exclude_subquery in (True, False):
+                expected = _all_simple_paths_lineage(holder, exclude_subquery)
+                assert holder.get_column_lineage(exclude_subquery) == expected
+                assert set(holder.iter_column_lineage(exclude_subquery)) == expected
+
+
+def test_column_lineage_endpoints():
+    for seed in range(20):
+        for allow_cycle in (False, True):
+            holder = _random_holder(seed, allow_cycle)
+            for exclude_subquery in (True, False):
+                expected = {
+                    (path[0], path[-1])
+                    for path in _all_simple_paths_lineage(holder, exclude_subquery)
+                }
+                assert holder.get_column_lineage_endpoints(exclude_subquery) == expected
+
+
+def test_column_lineage_without_lineage_edge():
+    graph = nx.DiGraph()
+    isolated = _column("col1", Table("tab1"))
+    graph.add_edge(isolated.parent, isolated, type=EdgeType.HAS_COLUMN)
+    src, tgt = _column("col2", Table("tab2")), _column("col2", Table("tab1"))
+    for col in (src, tgt):
+        graph.add_edge(col.parent, col, type=EdgeType.HAS_COLUMN)
+    graph.add_edge(src, tgt, type=EdgeType.LINEAGE)
+    holder = SQLLineageHolder(graph)
+    assert holder.get_column_lineage() == {(src, tgt)}
+    assert set(holder.iter_column_lineage()) == {(src, tgt)}
+    assert holder.get_column_lineage_endpoints() == {(src, tgt)}
+
+
+def test_merge_graph_same_as_compose():
+    g, h = nx.DiGraph(), nx.DiGraph()
+    g.add_node("a", read=True)
+    g.add_edge("a", "b", type=EdgeType.LINEAGE)
+    h.add_node("a", write=True)
+    h.add_edge("a", "b", type=EdgeType.RENAME)
+    h.add_edge("b", "c", type=EdgeType.LINEAGE)
+    composed = nx.compose(g, h)
+    merge_graph(g, h)
+    assert dict(g.nodes(data=True)) == dict(composed.nodes(data=True))
+    assert list(g.edges(data=True)) == list(composed.edges(data=True))
+    assert dict(h.nodes(data=True)) == {"a": {"write": True}, "b": {}, "c": {}}
+
+
+def test_rename_node_same_as_relabel_nodes():
+    old, new, other = Table("tab1"), Table("tab2"), Table("tab3")
+    col = _column("col1", old)
+    g = nx.DiGraph()
+    g.add_edge(other, old, type=EdgeType.LINEAGE)
+    g.add_edge(old, col, type=EdgeType.HAS_COLUMN)
+    g.add_edge(old, old, type=EdgeType.LINEAGE)
+    g.add_edge(old, new, type=EdgeType.RENAME)
+    relabeled = nx.relabel_nodes(g, {old: new})
+    rename_node(g, old, new)
+    assert set(g.nodes) == set(relabeled.nodes)
+    assert {(s, t, attr["type"]) for s, t, attr in g.edges(data=True)} == {
+        (s, t, attr["type"]) for s, t, attr in relabeled.edges(data=True)
+    }
+
+
+def test_subquery_holder_merge_in_place():
+    holder, other = SubQueryLineageHolder(), SubQueryLineageHolder()
+    graph = holder.graph
+    holder.add_read(Table("tab1"))
+    other.add_write(Table("tab2"))
+    holder |= other
+    assert holder.graph is graph
+    assert holder.read == {Table("tab1")} and holder.write == {Table("tab2")}
+    assert other.read == set()
+
+
+def test_tag_index_consistent_with_graph():
+    holder = SubQueryLineageHolder()
+    sq = SubQuery(None, "(SELECT col1 FROM tab1)", "sq")
+    holder.add_read(Table("tab1"))
+    holder.add_cte(sq)
+    holder.add_write(sq)
+    holder.write.clear()
+    assert holder.write == {sq} and holder.cte == {sq}
+    stmt_holder = StatementLineageHolder.of(holder)
+    stmt_holder.add_drop(Table("tab2"))
+    for h in (stmt_holder, pickle.loads(pickle.dumps(stmt_holder))):
+        for tag in ("read", "write", "cte", "drop"):
+            expected = {n for n, attr in h.graph.nodes(data=True) if attr.get(tag)}
+            assert h._property_getter(tag) == expected
+    assert stmt_holder.read == {Table("tab1")} and stmt_holder.write == set()
+    assert stmt_holder.drop == {Table("tab2")}
+
+
+def test_sql_holder_views_cached_until_invalidated():
+    g = nx.DiGraph()
+    g.add_edge(Table("tab1"), Table("tab2"), type=EdgeType.LINEAGE)
+    holder = SQLLineageHolder(g)
+    assert holder.table_lineage_graph is holder.table_lineage_graph
+    assert holder.column_lineage_graph is holder.column_lineage_graph
+    assert holder.target_tables == {Table("tab2")}
+    g.add_edge(Table("tab2"), Table("tab3"), type=EdgeType.LINEAGE)
+    assert holder.target_tables == {Table("tab2")}
+    holder.invalidate()
+    assert holder.source_tables == {Table("tab1")}
+    assert holder.intermediate_tables == {Table("tab2")}
+    assert holder.target_tables == {Table("tab3")}
@@ -0,0 +1,86 @@
+import pickle
+import random
+
+import networkx as nx
+import pytest
+
+from sqllineage.core.graph import CompactDiGraph, new_graph, to_networkx
+from sqllineage.core.holders import merge_graph, rename_node
+from sqllineage.core.models import Table
+from sqllineage.utils.constant import EdgeTag, EdgeType, NodeTag
+
+
+def _edges(edges):
+    return sorted((str(u), str(v), sorted(attr.items())) for u, v, attr in edges)
+
+
+def _nodes(g):
+    return sorted((str(n), sorted(attr.items())) for n, attr in g.nodes(data=True))
+
+
+def _assert_same(compact, digraph):
+    assert _nodes(compact) == _nodes(digraph)
+    assert _edges(compact.edges(data=True)) == _edges(digraph.edges(data=True))
+    assert dict(compact.degree) == dict(digraph.degree)
+    assert dict(compact.in_degree) == dict(digraph.in_degree)
+    assert dict(compact.out_degree) == dict(digraph.out_degree)
+    for n in digraph.nodes:
+        assert list(compact.successors(n)) == list(digraph.successors(n))
+        assert list(compact.out_edges(n, data=True)) == list(
+            digraph.out_edges(n, data=True)
+        )
+        # like DiGraph.copy, a copied graph keeps successors order but not predecessors order
+        assert set(compact.predecessors(n)) == set(digraph.predecessors(n))
+        assert _edges(compact.in_edges(n, data=True)) == _edges(
+            digraph.in_edges(n, data=True)
+        )
+
+
+def test_compact_graph_same_as_digraph():
+    rnd = random.Random(0)
+    tables = [Table(f"tab{i}") for i in range(20)]
+    compact, digraph = CompactDiGraph(), nx.DiGraph()
+    for _ in range(500):
+        op = rnd.random()
+        u, v = rnd.choice(tables), rnd.choice(tables)
+        if op < 0.6:
+            attr = {"type": rnd.choice(list(EdgeType))}
+            if rnd.random() < 0.2:
+                attr[EdgeTag.INDEX] = rnd.randint(0, 3)
+            for g in (compact, digraph):
+                g.add_edge(u, v, **attr)
+        elif op < 0.75:
+            tag = rnd.choice([NodeTag.READ, NodeTag.WRITE, "extra"])
+            for g in (compact, digraph):
+                g.add_node(u, **{tag: True})
+        elif op < 0.9 and digraph.has_edge(u, v):
+            for g in (compact, digraph):
+                g.remove_edge(u, v)
+        elif digraph.has_node(u):
+            for g in (compact, digraph):
+                g.remove_node(u)
+        assert compact.has_edge(u, v) == digraph.has_edge(u, v)
+    _assert_same(compact, digraph)
+    _assert_same(compact.subgraph(tables[:10]), digraph.subgraph(tables[:10]))
+    _assert_same(pickle.loads(pickle.dumps(compact)), digraph)
+    _assert_same(to_networkx(compact), digraph)
+    _assert_same(CompactDiGraph.from_networkx(digraph), digraph)
+
+
+def test_compact_graph_holder_operations():
+    old, new, other = Table("tab1"), Table("tab2"), Table("tab3")
+    graphs = []
+    for g in (CompactDiGraph(), nx.DiGraph()):
+        g.add_edge(other, old, type=EdgeType.LINEAGE)
+        g.add_edge(old, old, type=EdgeType.LINEAGE)
+        g.add_edge(old, new, type=EdgeType.RENAME)
+        rename_node(g, old, new)
+        h = new_graph("networkx")
+        h.add_node(other, **{NodeTag.WRITE: True})
+        merge_graph(g, h)
+        graphs.append(g)
+    _assert_same(*graphs)
+    with pytest.raises(nx.NetworkXError):
+        graphs[0].remove_node(old)
+    with pytest.raises(ValueError):
+        new_graph("unknown")
@@ -0,0 +1,67 @@
+import gc
+
+from sqllineage.core.interning import InternRegistry, intern_registry
+from sqllineage.core.models import Column, Path, Schema, SubQuery, Table
+from sqllineage.runner import LineageRunner
+
+
+def test_intern_returns_canonical_instance():
+    registry = InternRegistry()
+    tab = registry.intern(Table("schema1.tab1"))
+    assert registry.intern(Table("SCHEMA1.TAB1")) is tab
+    assert registry.intern(Table("tab1.schema1")) is not tab
+    assert registry.intern(Schema("schema1")) is tab.schema
+    assert registry.intern(Path("s3://bucket")) is registry.intern(Path("s3://bucket"))
+    col = Column("col1")
+    col.parent = Table("schema1.tab1")
+    assert registry.intern(col).parent is tab
+    # schemas of equal tables are collapsed too
+    assert registry.stats().collapsed == 6
+
+
+def test_intern_does_not_modify_input():
+    registry = InternRegistry()
+    tab = registry.intern(Table("schema1.tab1"))
+    schema = Schema("schema1")
+    col = Column("col1")
+    col.parent = Table("tab1", schema)
+    canonical = registry.intern(col)
+    assert canonical is not col and canonical == col
+    assert canonical.parent is tab and hash(canonical) == hash(col)
+    assert col.parent is not tab and col.parent.schema is schema
+    other = Table("tab2", schema)
+    assert registry.intern(other).schema is tab.schema
+    assert other.schema is schema
+
+
+def test_intern_keeps_ambiguous_column_and_subquery():
+    registry = InternRegistry()
+    sq = SubQuery(None, "(SELECT 1)", "sq")
+    assert registry.intern(sq) is sq
+    col1, col2 = Column("col1"), Column("col1")
+    col1.parent, col1.parent = Table("tab1"), Table("tab2")
+    assert registry.intern(col1) is col1 and registry.intern(col2) is col2
+    assert registry.stats().lookups == 0
+
+
+def test_intern_registry_is_weak():
+    registry = InternRegistry()
+    registry.intern(Table("schema1.tab1"))
+    gc.collect()
+    assert registry.stats().size == 0
+    registry.clear()
+    assert registry.stats() == (0, 0, 0)
+
+
+def test_runner_intern():
+    sql = "INSERT INTO tab2 SELECT col1 FROM tab1"
+    intern_registry.clear()
+    runner1 = LineageRunner(sql, intern=True)
+    runner2 = LineageRunner(sql, intern=True)
+    assert runner1.source_tables[0] is runner2.source_tables[0]
+    assert runner1.get_column_lineage() == runner2.get_column_lineage()
+    assert intern_registry.stats().collapsed > 0
+    results = list(LineageRunner.analyze_many([sql, sql], workers=1, intern=True))
+    assert (
+        results[0].holder.source_tables.pop() is results[1].holder.source_tables.pop()
+    )
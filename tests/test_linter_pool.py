@@ -0,0 +1,49 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from sqllineage.core.parser.sqlfluff.linter_pool import LinterPool
+from sqllineage.runner import LineageRunner
+
+
+def test_linter_reused_for_same_dialect():
+    pool = LinterPool()
+    with pool.acquire("ansi") as linter:
+        pass
+    with pool.acquire("ansi") as reused:
+        assert reused is linter
+    with pool.acquire("mysql") as other:
+        assert other is not linter
+
+
+def test_linter_not_shared_while_acquired():
+    pool = LinterPool()
+    with pool.acquire("ansi") as linter:
+        with pool.acquire("ansi") as another:
+            assert another is not linter
+    assert pool.stats() == {"ansi": 2}
+
+
+def test_pool_bounded_size():
+    pool = LinterPool(max_size=1)
+    with pool.acquire("ansi"):
+        with pool.acquire("ansi"):
+            pass
+    assert pool.stats() == {"ansi": 1}
+    pool.clear()
+    assert pool.stats() == {}
+
+
+def test_warm_up():
+    pool = LinterPool(max_size=2)
+    pool.warm_up("ansi", "hive", size=3)
+    assert pool.stats() == {"ansi": 2, "hive": 2}
+
+
+def test_concurrent_analysis():
+    sql = "INSERT INTO tab1 SELECT * FROM tab2"
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(
+                lambda _: LineageRunner(sql, dialect="ansi").source_tables, range(8)
+            )
+        )
+    assert all(str(tables[0]) == "<default>.tab2" for tables in results)
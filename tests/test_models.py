@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 from sqlparse.sql import Parenthesis
 
@@ -32,3 +34,31 @@ def test_of_dummy():
         Table.of("")
     with pytest.raises(NotImplementedError):
         SubQuery.of("", None)
+
+
+def test_subquery_pickle_without_query():
+    sq = SubQuery(Parenthesis(), "(select 1)", "sq")
+    unpickled = pickle.loads(pickle.dumps(sq))
+    assert unpickled == sq and unpickled.alias == "sq"
+    assert unpickled.query is None
+
+
+def test_column_key_follows_parent():
+    col = Column("col1")
+    assert str(col) == "col1" and col == Column("col1")
+    col.parent = Table("tab1")
+    assert str(col) == "<default>.tab1.col1" and hash(col) == hash(str(col))
+    col.parent = Table("tab2")
+    assert str(col) == "col1" and col.parent is None
+    assert col.parent_candidates == [Table("tab1"), Table("tab2")]
+
+
+def test_models_pickle_with_key():
+    col = Column("col1")
+    col.parent = Table("schema1.tab1", alias="t")
+    for obj in (Schema("schema1"), Table("tab1"), Path("s3://bucket/key"), col):
+        assert not hasattr(obj, "__dict__")
+        unpickled = pickle.loads(pickle.dumps(obj))
+        assert unpickled == obj and hash(unpickled) == hash(obj)
+        assert str(unpickled) == str(obj)
+    assert pickle.loads(pickle.dumps(col)).parent.alias == "t"
@@ -13,17 +13,17 @@ from sqllineage.core.parser.sqlfluff.models import SqlFluffColumn
 def test_column_extract_source_columns():
     segment_mock = Mock()
     segment_mock.type = ""
-    assert [] == SqlFluffColumn._extract_source_columns(segment_mock)
+    assert [] == SqlFluffColumn._extract_source_columns(segment_mock, "ansi")
 
 
 def test_handler_dummy():
     segment_mock = Mock()
     holder = SubQueryLineageHolder()
-    c_handler = ConditionalSegmentBaseHandler()
+    c_handler = ConditionalSegmentBaseHandler("ansi")
     with pytest.raises(NotImplementedError):
         c_handler.handle(segment_mock, holder)
     with pytest.raises(NotImplementedError):
         c_handler.indicate(segment_mock)
-    s_handler = SegmentBaseHandler()
+    s_handler = SegmentBaseHandler("ansi")
     with pytest.raises(NotImplementedError):
         s_handler.handle(segment_mock, holder)
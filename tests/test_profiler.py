@@ -0,0 +1,69 @@
+import time
+
+from sqllineage.cli import main
+from sqllineage.core.cache import LineageCache
+from sqllineage.core.profiler import LineageProfile, profiler
+from sqllineage.runner import LineageRunner
+
+
+def test_profile_disabled_by_default():
+    assert LineageRunner("select * from tab1").profile is None
+
+
+def test_profile_stages_and_statements(monkeypatch):
+    # cache hits are asserted below, so pin a cache regardless of SQLLINEAGE_CACHE_SIZE
+    monkeypatch.setattr("sqllineage.runner.lineage_cache", LineageCache(max_size=8))
+    sql = """insert into profile_tab1 select * from profile_tab2;
+insert into profile_tab3 select col1 from profile_tab1"""
+    runner = LineageRunner(sql, dialect="ansi", profile=True)
+    runner.get_column_lineage()
+    profile = runner.profile
+    assert profile is not None
+    for stage in ("split", "cache", "parse", "extract", "build_graph"):
+        assert stage in profile.stages
+    assert "column_lineage" in profile.stages
+    assert [s.position for s in profile.statements] == [0, 1]
+    assert all(s.nodes > 0 and s.edges > 0 for s in profile.statements)
+    assert (profile.cache_hits, profile.cache_misses) == (0, 2)
+    assert profile.nodes > 0 and profile.edges > 0
+    assert "slowest statements" in profile.report()
+
+    cached = LineageRunner(sql, dialect="ansi", profile=True)
+    cached.source_tables
+    assert cached.profile is not None
+    assert (cached.profile.cache_hits, cached.profile.cache_misses) == (2, 0)
+    assert all(s.cached for s in cached.profile.statements)
+    assert "parse" not in cached.profile.stages
+
+
+def test_profile_from_file(tmp_path):
+    path = tmp_path / "script.sql"
+    path.write_text(
+        "insert into profile_tab4 select * from profile_tab5;\n"
+        "insert into profile_tab6 select * from profile_tab4;\n"
+    )
+    runner = LineageRunner.from_file(str(path), profile=True)
+    runner.target_tables
+    assert runner.profile is not None
+    assert "split" in runner.profile.stages
+    assert len(runner.profile.statements) == 2
+
+
+def test_nested_stage_excluded_from_outer():
+    profile = LineageProfile()
+    with profiler.activate(profile):
+        with profiler.stage("outer"):
+            with profiler.stage("inner"):
+                time.sleep(0.05)
+    assert profile.stages["inner"] >= 0.05
+    assert profile.stages["outer"] < 0.05
+    with profiler.stage("inactive"):
+        pass
+    assert "inactive" not in profile.stages
+
+
+def test_cli_profile(capsys):
+    main(["-e", "insert into profile_tab7 select * from profile_tab8", "--profile"])
+    captured = capsys.readouterr()
+    assert "profile_tab8" in captured.out
+    assert "slowest statements" in captured.err
@@ -11,3 +11,63 @@ insert into tab3 select * from tab2""",
     assert str(runner)
     assert runner.to_cytoscape() is not None
     assert runner.to_cytoscape(level=LineageLevel.COLUMN) is not None
+
+
+def test_analyze_many():
+    sqls = [
+        "insert into tab2 select * from tab1",
+        "select * from where foo='bar'",
+        "insert into tab4 select * from tab3; insert into tab5 select * from tab4",
+    ]
+    for workers in (1, 2):
+        results = sorted(
+            LineageRunner.analyze_many(sqls, dialect="ansi", workers=workers),
+            key=lambda r: r.position,
+        )
+        assert [r.position for r in results] == [0, 1, 2]
+        assert {str(t) for t in results[0].holder.source_tables} == {"<default>.tab1"}
+        assert results[1].holder is None and results[1].error is not None
+        assert {str(t) for t in results[2].holder.target_tables} == {"<default>.tab5"}
+        assert {str(t) for t in results[2].holder.intermediate_tables} == {
+            "<default>.tab4"
+        }
+
+
+def test_runner_parallel():
+    sql = ";\n".join(
+        f"insert into tab{i + 1} select a.col1 from (select col1 from tab{i}) a"
+        for i in range(10)
+    )
+    runner = LineageRunner(sql, dialect="ansi")
+    runner_parallel = LineageRunner(sql, dialect="ansi", workers=2)
+    assert str(runner_parallel) == str(runner)
+    assert runner_parallel.get_column_lineage() == runner.get_column_lineage()
+
+
+def test_runner_column_lineage_endpoints():
+    sql = """insert into tab2 select col1 from tab1;
+insert into tab3 select col1 from tab2"""
+    runner = LineageRunner(sql, dialect="ansi")
+    assert [
+        (str(src), str(tgt)) for src, tgt in runner.get_column_lineage_endpoints()
+    ] == [("<default>.tab1.col1", "<default>.tab3.col1")]
+    assert [len(path) for path in runner.get_column_lineage()] == [3]
+
+
+def test_runner_from_file(tmp_path):
+    sql = ";\n".join(
+        f"insert into tab{i + 1} select col1 from tab{i}" for i in range(10)
+    )
+    path = tmp_path / "script.sql"
+    path.write_text(sql)
+    runner = LineageRunner(sql, dialect="ansi", verbose=True)
+    for workers in (1, 2):
+        for verbose in (True, False):
+            runner_file = LineageRunner.from_file(
+                str(path), dialect="ansi", verbose=verbose, workers=workers
+            )
+            assert runner_file.statements() == [s.strip() for s in runner.statements()]
+            assert runner_file.source_tables == runner.source_tables
+            assert runner_file.get_column_lineage() == runner.get_column_lineage()
+            if verbose:
+                assert str(runner_file) == str(runner)
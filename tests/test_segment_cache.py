@@ -0,0 +1,55 @@
+from sqllineage.core.parser.sqlfluff.linter_pool import linter_pool
+from sqllineage.core.parser.sqlfluff.segment_cache import SegmentCache
+from sqllineage.core.parser.sqlfluff.utils import get_statement_segment
+
+
+def _parse(sql: str):
+    with linter_pool.acquire("ansi") as linter:
+        return get_statement_segment(linter.parse_string(sql))
+
+
+def _counting_predicate(cache: SegmentCache):
+    calls = []
+
+    @cache.memoize
+    def predicate(segment) -> bool:
+        calls.append(segment)
+        return segment.type == "select_statement"
+
+    return predicate, calls
+
+
+def test_predicate_computed_once_per_segment_in_scope():
+    cache = SegmentCache()
+    predicate, calls = _counting_predicate(cache)
+    segment = _parse("SELECT col1 FROM tab1")
+    with cache.scope():
+        assert predicate(segment) is True
+        assert predicate(segment) is True
+        for child in segment.segments:
+            predicate(child)
+            predicate(child)
+    assert len(calls) == 1 + len(segment.segments)
+
+
+def test_predicate_not_cached_out_of_scope():
+    cache = SegmentCache()
+    predicate, calls = _counting_predicate(cache)
+    segment = _parse("SELECT col1 FROM tab1")
+    with cache.scope():
+        predicate(segment)
+    predicate(segment)
+    predicate(segment)
+    assert len(calls) == 3
+
+
+def test_nested_scope_shares_cache():
+    cache = SegmentCache()
+    predicate, calls = _counting_predicate(cache)
+    segment = _parse("SELECT col1 FROM tab1")
+    with cache.scope():
+        predicate(segment)
+        with cache.scope():
+            predicate(segment)
+        predicate(segment)
+    assert len(calls) == 1
@@ -0,0 +1,229 @@
+import os
+
+import pytest
+import sqlparse
+
+from sqllineage import DATA_FOLDER
+from sqllineage.utils.helpers import split
+from sqllineage.utils.splitter import (
+    StatementSplitter,
+    find_comments,
+    iter_statements,
+    strip_comments,
+)
+
+
+def _sqlparse_split(sql: str):
+    # how statements were split before, with sqlparse
+    return [s.value for s in sqlparse.parse(sql) if s.token_first(skip_cm=True)]
+
+
+def _sqlparse_strip_comments(sql: str):
+    # how comments were stripped before, with sqlparse
+    return str(sqlparse.format(sql, strip_comments=True))
+
+
+def _split(sql: str, chunk_size: int, **kwargs):
+    splitter = StatementSplitter(**kwargs)
+    statements = []
+    for start in range(0, len(sql), chunk_size):
+        end = start + chunk_size
+        statements += splitter.feed(sql[start:end])
+    return [s.sql for s in statements + splitter.close()]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 1000])
+def test_split_in_chunks(chunk_size):
+    sql = """-- leading comment; not a statement
+select 'a;b', 'it''s;', 'back\\';slash', "c;d", `e;f` from tab1;
+/* block; comment */ select 1 # ;
+-- only comment;
+;
+select 2;
+;
+create function f() returns int as $body$ select 1; $body$ language sql;
+select $1, a$b$ from tab2;
+select * from tab3"""
+    assert _split(sql, chunk_size) == [
+        """-- leading comment; not a statement
+select 'a;b', 'it''s;', 'back\\';slash', "c;d", `e;f` from tab1;""",
+        """/* block; comment */ select 1 # ;
+-- only comment;
+;""",
+        "select 2;",
+        ";",
+        "create function f() returns int as $body$ select 1; $body$ language sql;",
+        "select $1, a$b$ from tab2;",
+        "select * from tab3",
+    ]
+
+
+def test_iter_statements_offset(tmp_path):
+    content = "select 'é';\n\n  insert into tab1 select * from tab2;\n"
+    path = tmp_path / "script.sql"
+    path.write_bytes(content.encode("utf-8"))
+    data = path.read_bytes()
+    statements = list(iter_statements(str(path), "utf-8", chunk_size=3))
+    assert [s.sql for s in statements] == [
+        "select 'é';",
+        "insert into tab1 select * from tab2;",
+    ]
+    for s in statements:
+        offset = s.offset
+        assert data[offset:].decode("utf-8").startswith(s.sql)
+
+
+def _data_files():
+    for dirname, _, files in os.walk(DATA_FOLDER):
+        for file in sorted(files):
+            if file.endswith(".sql"):
+                yield os.path.join(dirname, file)
+
+
+@pytest.mark.parametrize("path", sorted(_data_files()))
+def test_split_conform_to_sqlparse_on_data_files(path):
+    with open(path) as f:
+        sql = f.read()
+    assert split(sql) == _sqlparse_split(sql)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "select 1;select 2",
+        "\n\nselect 1\n;\n\nselect 2;\n\n",
+        "select 1; -- comment; after\n  # another\nselect 2;",
+        "select 1; --+ hint\nselect 2; /* block */ select 3;",
+        "-- comment only;\nselect 1;\n-- trailing comment",
+        "select 1;;\n;",
+        "select 'a;b', \"c;d\", `e;f`, 'it''s;', 'back\\';slash' from tab1; select 2",
+        "select [a;b] from [t(1]; select a[1] from tab1;",
+        "select func(a; b); select 1",
+        "create function f() returns int as $body$ select 1; $body$ language sql; select 1",
+        "select x$;y from tab1;",
+        """CREATE PROCEDURE p()
+BEGIN
+  DECLARE x INT;
+  SET x = 1;
+  IF x > 0 THEN
+    SELECT 1;
+  END IF;
+  WHILE x < 10 DO
+    SET x = x + 1;
+  END WHILE;
+  CASE x WHEN 1 THEN SELECT 1; ELSE SELECT 2; END CASE;
+END;
+INSERT INTO tab1 SELECT * FROM tab2;""",
+        """create or replace procedure p is
+  a number;
+begin
+  for i in 1..10 loop
+    null;
+  end loop;
+end;
+insert into tab1 select * from tab2;""",
+        """CREATE TRIGGER t BEFORE INSERT ON tab1 FOR EACH ROW
+BEGIN
+  DECLARE CONTINUE HANDLER FOR SQLEXCEPTION BEGIN END;
+  SET NEW.a = 1;
+END;
+select 1;""",
+        "BEGIN; INSERT INTO tab1 VALUES (1); COMMIT;",
+        "select case when a then b end from tab1; select 1;",
+        "select end.x, begin.y from tab1 begin; end; select if(a, b, c) from tab1;",
+        "select :begin, @if, #for, $case, x::begin from tab1; select 1;",
+        "select 1; end if",
+        "select 1; end loop",
+        "select 1; handler for",
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_split_conform_to_sqlparse(sql, chunk_size):
+    expected = _sqlparse_split(sql)
+    assert split(sql) == expected
+    assert _split(sql, chunk_size, strip=False) == expected
+
+
+@pytest.mark.parametrize("split_on_go", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 1000])
+def test_split_in_chunks_same_as_whole(chunk_size, split_on_go):
+    sql = """select 1;$$a;b$$; select 2; $tag$c;d$tag$;x$$e;f$$ from tab1;
+GO
+select 3; GO
+select 4;$1;#for
+select 5"""
+    splitter = StatementSplitter(strip=False, split_on_go=split_on_go)
+    whole = [s.sql for s in splitter.feed(sql) + splitter.close()]
+    assert _split(sql, chunk_size, strip=False, split_on_go=split_on_go) == whole
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1000])
+def test_split_on_go(chunk_size):
+    sql = """select 1
+GO
+select 2;
+  go 5
+select go from tab1
+-- comment only
+GO
+select 3"""
+    assert split(sql, "tsql") == [
+        "select 1\n",
+        "select 2;",
+        "select go from tab1\n-- comment only\n",
+        "select 3",
+    ]
+    assert _split(sql, chunk_size, split_on_go=True) == [
+        "select 1",
+        "select 2;",
+        "select go from tab1\n-- comment only",
+        "select 3",
+    ]
+    assert len(split(sql)) == 2
+
+
+@pytest.mark.parametrize("path", sorted(_data_files()))
+def test_strip_comments_conform_to_sqlparse_on_data_files(path):
+    with open(path) as f:
+        for sql in split(f.read()):
+            assert strip_comments(sql) == _sqlparse_strip_comments(sql)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "-- leading\n  select 1",
+        "\n-- leading after newline\nselect 1",
+        "select a, -- first\n  -- second\n    b from tab1",
+        "select a /* inline */ from tab1",
+        "select a/* no space */from tab1",
+        "select count(/* nothing */*) from (-- open\n select 1) t",
+        "select 1 -- end\r\n-- another\n",
+        "select '-- not; a comment', \"/* nor this */\" from tab1 # hash comment\n  where x = 1",
+        "select /*+ BROADCAST(t) */ * from tab1 t --+ hint\n",
+        "insert into tab1\n-- one\n\n\n-- two\n    select * from tab2   \n  where y = 1  ",
+        "create function f() returns int as $$ select 1 -- kept\n $$ language sql",
+    ],
+)
+def test_strip_comments_conform_to_sqlparse(sql):
+    assert strip_comments(sql) == _sqlparse_strip_comments(sql)
+
+
+@pytest.mark.parametrize("strip", [True, False])
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_split_records_comments(strip, chunk_size):
+    sql = """-- leading comment
+select /* block
+comment */ a from tab1; -- trailing comment
+  # another trailing comment
+select 'a -- b' from tab2 -- comment at the end"""
+    splitter = StatementSplitter(strip=strip)
+    statements = []
+    for start in range(0, len(sql), chunk_size):
+        end = start + chunk_size
+        statements += splitter.feed(sql[start:end])
+    statements += splitter.close()
+    assert len(statements) == 2
+    for s in statements:
+        assert list(s.comments) == find_comments(s.sql)
+        assert strip_comments(s.sql, s.comments) == strip_comments(s.sql)
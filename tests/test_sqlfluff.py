@@ -1,5 +1,10 @@
 import pytest
 
+from sqllineage.core.parser.sqlfluff.extractors import EXTRACTORS
+from sqllineage.core.parser.sqlfluff.extractors.lineage_holder_extractor import (
+    LineageHolderExtractor,
+)
+from sqllineage.core.parser.sqlfluff.utils import clean_parentheses
 from sqllineage.utils.entities import ColumnQualifierTuple
 from .helpers import assert_column_lineage_equal, assert_table_lineage_equal
 
@@ -278,3 +283,26 @@ def test_insert_with_custom_columns():
         ],
         test_sqlparse=False,
     )
+
+
+def test_clean_parentheses():
+    assert (
+        clean_parentheses("SELECT col1 FROM (((SELECT max(col1) FROM tab1))) dt")
+        == "SELECT col1 FROM (SELECT max(col1) FROM tab1) dt"
+    )
+    assert (
+        clean_parentheses("SELECT ((a) + (b)), '((c))' /* ((d)) */ FROM tab1")
+        == "SELECT ((a) + (b)), '((c))' /* ((d)) */ FROM tab1"
+    )
+
+
+def test_clean_deeply_nested_parentheses():
+    depth = 5000
+    sql = "SELECT col1 FROM " + "(" * depth + "SELECT col1 FROM tab1" + ")" * depth
+    assert clean_parentheses(sql) == "SELECT col1 FROM (SELECT col1 FROM tab1)"
+
+
+def test_extractor_registry():
+    for extractor_cls in LineageHolderExtractor.__subclasses__():
+        for statement_type in extractor_cls.SUPPORTED_STMT_TYPES:
+            assert EXTRACTORS[statement_type] is extractor_cls